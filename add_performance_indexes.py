@@ -6,14 +6,215 @@ Run this script to optimize database queries for the form system.
 
 import asyncio
 import logging
+import sys
+from datetime import datetime, timezone
+from bson import SON
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure
 from app.config.settings import settings
+from app.utils.db_indexes import CASE_INSENSITIVE_COLLATION
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def add_performance_indexes():
-    """Add database indexes to improve query performance."""
+# IndexOptionsConflict / IndexKeySpecsConflict: same index exists with other options
+INDEX_CONFLICT_CODES = (85, 86)
+
+# Submissions older than this many months drop out of the "hot" partial indexes
+HOT_WINDOW_MONTHS = 6
+
+# Script-only spec options, never sent to the server:
+#   rolling  - the partial filter moves over time; drop and rebuild on conflict
+#   replaces - older index names superseded by this one, dropped if present
+_META_OPTIONS = ("rolling", "replaces")
+
+
+def _hot_window_start(now=None):
+    """
+    First day of the month HOT_WINDOW_MONTHS back. Month granularity keeps
+    re-runs within the same month no-ops; rerun the script monthly (cron) to
+    roll the window forward.
+    """
+    now = now or datetime.now(timezone.utc)
+    months = now.year * 12 + now.month - 1 - HOT_WINDOW_MONTHS
+    return datetime(months // 12, months % 12 + 1, 1)
+
+
+# Index specs per collection: (key, extra create_index options).
+# Only the widest compound is kept per access pattern; a leftmost prefix of
+# a compound index is already served by the compound itself.
+INDEX_SPECS = {
+    "contexts": [
+        # One index per branch of the context-access $or. assigned_users and
+        # assigned_professionals are both arrays, so no compound can hold both
+        ("created_by", {
+            "replaces": [
+                "created_by_1_assigned_users_1",
+                "created_by_1_assigned_users_1_assigned_professionals_1",
+            ],
+        }),
+        ("assigned_users", {}),
+        ("assigned_professionals", {}),
+    ],
+    "form_templates": [
+        ("title", {}),
+        ([("context_id", 1), ("status", 1), ("created_at", -1)], {
+            "replaces": ["context_id_1", "context_id_1_status_1"],
+        }),
+        # Active templates newest first; drafts and archived ones stay out of the index
+        ([("status", 1), ("created_at", -1)], {"partialFilterExpression": {"status": "active"}}),
+        # Queries on any other status still need a full index
+        ("status", {}),
+        ([("tags", 1), ("context_id", 1)], {"replaces": ["tags_1"]}),
+    ],
+    "conversation_logs": [
+        ("created_at", {}),
+        ([("session_id", 1), ("created_at", 1)], {"replaces": ["session_id_1"]}),
+        # Same spec as app/utils/db_indexes.py; serves user_id-only lookups
+        ([("user_id", 1), ("timestamp", -1)], {"replaces": ["user_id_1"]}),
+    ],
+    "form_responses": [
+        ("created_at", {}),
+        # Per-user history only ever looks at recent submissions
+        ([("user_id", 1), ("created_at", -1)], {
+            "name": "user_recent",
+            "partialFilterExpression": {"created_at": {"$gte": _hot_window_start()}},
+            "rolling": True,
+            "replaces": ["user_id_1_created_at_-1"],
+        }),
+        ([("form_template_id", 1), ("created_at", -1)], {"replaces": ["form_template_id_1"]}),
+        # Full-history counterpart of user_recent, same spec as app/utils/db_indexes.py
+        ([("user_id", 1), ("submitted_at", -1)], {"replaces": ["user_id_1"]}),
+        ([("form_template_id", 1), ("user_id", 1), ("created_at", -1)], {}),
+    ],
+    "users": [
+        # Case-insensitive uniqueness: "Alice@x.com" and "alice@x.com" collide
+        ("email", {
+            "name": "email_ci",
+            "unique": True,
+            "collation": CASE_INSENSITIVE_COLLATION,
+            "replaces": ["email_1"],
+        }),
+        # Not every user has a username; only index the ones that do
+        ("username", {
+            "name": "username_ci",
+            "unique": True,
+            "collation": CASE_INSENSITIVE_COLLATION,
+            "partialFilterExpression": {"username": {"$type": "string"}},
+            "replaces": ["username_1"],
+        }),
+    ],
+}
+
+
+def _normalize_key(key):
+    """Return an index key as a list of (field, direction) pairs."""
+    if isinstance(key, str):
+        return [(key, 1)]
+    return list(key)
+
+
+def _mk_name(key):
+    """Build the same default index name MongoDB would generate."""
+    return "_".join(f"{field}_{direction}" for field, direction in _normalize_key(key))
+
+
+def find_shadowed_indexes(indexes):
+    """
+    Return the names of indexes whose key is a leftmost prefix of another
+    non-unique, non-partial index on the same collection.
+    """
+    def is_plain(idx):
+        return not idx.get("unique") and "partialFilterExpression" not in idx
+
+    keys = {
+        idx["name"]: list(idx.get("key", {}).items())
+        for idx in indexes
+        if idx.get("name") != "_id_" and is_plain(idx)
+    }
+    shadowed = []
+    for name, key in keys.items():
+        for other_name, other_key in keys.items():
+            if other_name != name and len(other_key) > len(key) and other_key[:len(key)] == key:
+                shadowed.append(name)
+                break
+    return shadowed
+
+
+def _index_document(key, opts):
+    """Build a createIndexes spec entry for one index."""
+    return {
+        "key": dict(_normalize_key(key)),
+        "name": opts.get("name") or _mk_name(key),
+        "background": True,
+        **{k: v for k, v in opts.items() if k != "name" and k not in _META_OPTIONS},
+    }
+
+
+async def _drop_existing_indexes(db, collection_name, names):
+    """Drop whichever of the given index names exist on the collection."""
+    if not names:
+        return
+    existing = {idx["name"] async for idx in db[collection_name].list_indexes()}
+    for name in set(names) & existing:
+        logger.info(f"Dropping index {collection_name}.{name}")
+        await db[collection_name].drop_index(name)
+
+
+async def _create_collection_indexes(db, collection_name, specs):
+    """
+    Create all indexes for one collection with a single createIndexes command,
+    so the server scans the collection once. Returns the names that failed.
+
+    If an index already exists with different options (codes 85/86), the
+    batch is retried one index at a time so the remaining ones still get
+    built and re-runs stay no-ops.
+    """
+    documents = [_index_document(key, opts) for key, opts in specs]
+    replaces = {
+        document["name"]: list(opts.get("replaces", ()))
+        for document, (_, opts) in zip(documents, specs)
+    }
+    superseded = [name for names in replaces.values() for name in names]
+    rolling = {document["name"] for document, (_, opts) in zip(documents, specs) if opts.get("rolling")}
+    try:
+        await db.command(SON([("createIndexes", collection_name), ("indexes", documents)]))
+        # Only drop superseded indexes once their replacements exist
+        await _drop_existing_indexes(db, collection_name, superseded)
+        return []
+    except OperationFailure as e:
+        if e.code not in INDEX_CONFLICT_CODES:
+            raise
+        logger.warning(f"Index conflict on {collection_name}, retrying individually: {e}")
+
+    failed = []
+    for document in documents:
+        try:
+            await db.command(SON([("createIndexes", collection_name), ("indexes", [document])]))
+        except OperationFailure as e:
+            if e.code not in INDEX_CONFLICT_CODES:
+                raise
+            if document["name"] in rolling:
+                # Partial filter window moved on (or the old unfiltered index
+                # still holds the key pattern): rebuild with the new threshold
+                logger.info(f"  - rolling {document['name']} forward")
+                await _drop_existing_indexes(
+                    db, collection_name, [document["name"], *replaces[document["name"]]]
+                )
+                await db.command(SON([("createIndexes", collection_name), ("indexes", [document])]))
+                continue
+            logger.warning(f"  - {document['name']} already exists with other options: {e}")
+            failed.append(document["name"])
+    if not failed:
+        await _drop_existing_indexes(db, collection_name, superseded)
+    return failed
+
+
+async def add_performance_indexes(verify: bool = False):
+    """
+    Add database indexes to improve query performance.
+    Pass verify=True (or --verify on the command line) to log every index afterwards.
+    """
 
     # Connect to MongoDB
     client = AsyncIOMotorClient(settings.MONGODB_URL)
@@ -22,63 +223,48 @@ async def add_performance_indexes():
     try:
         logger.info("Adding performance indexes...")
 
-        # Indexes for contexts collection
-        logger.info("Adding indexes for contexts collection...")
-        await db.contexts.create_index("created_by")
-        await db.contexts.create_index("assigned_users")
-        await db.contexts.create_index("assigned_professionals")
-        await db.contexts.create_index([("created_by", 1), ("assigned_users", 1)])
-
-        # Indexes for form_templates collection
-        logger.info("Adding indexes for form_templates collection...")
-        await db.form_templates.create_index("context_id")
-        await db.form_templates.create_index("status")
-        await db.form_templates.create_index([("context_id", 1), ("status", 1)])
-        await db.form_templates.create_index("title")
-        await db.form_templates.create_index("tags")
-
-        # Indexes for conversation_logs collection
-        logger.info("Adding indexes for conversation_logs collection...")
-        await db.conversation_logs.create_index("session_id")
-        await db.conversation_logs.create_index("created_at")
-        await db.conversation_logs.create_index([("session_id", 1), ("created_at", 1)])
-
-        # Indexes for form_responses collection
-        logger.info("Adding indexes for form_responses collection...")
-        await db.form_responses.create_index("user_id")
-        await db.form_responses.create_index("form_template_id")
-        await db.form_responses.create_index("created_at")
-        await db.form_responses.create_index([("user_id", 1), ("created_at", -1)])
-        await db.form_responses.create_index([("form_template_id", 1), ("created_at", -1)])
-
-        # Indexes for users collection
-        logger.info("Adding indexes for users collection...")
-        await db.users.create_index("email", unique=True)
-        await db.users.create_index("username", unique=True)
-
-        # Compound indexes for common queries
-        logger.info("Adding compound indexes...")
-        await db.contexts.create_index([
-            ("created_by", 1),
-            ("assigned_users", 1),
-            ("assigned_professionals", 1)
-        ])
-
-        await db.form_templates.create_index([
-            ("context_id", 1),
-            ("status", 1),
-            ("created_at", -1)
-        ])
-
-        logger.info("✅ All performance indexes added successfully!")
-
-        # List all indexes for verification
-        logger.info("Current indexes:")
-        for collection_name in ["contexts", "form_templates", "conversation_logs", "form_responses", "users"]:
-            indexes = await db[collection_name].list_indexes().to_list(None)
-            logger.info(f"{collection_name}: {len(indexes)} indexes")
-            for idx in indexes:
-                logger.info(f"  - {idx.get('name', 'unnamed')}: {idx.get('key', {})}")
+        collection_names = list(INDEX_SPECS)
+        results = await asyncio.gather(
+            *(_create_collection_indexes(db, c, INDEX_SPECS[c]) for c in collection_names),
+            return_exceptions=True,
+        )
+
+        failures = 0
+        for collection_name, result in zip(collection_names, results):
+            if isinstance(result, Exception):
+                failures += len(INDEX_SPECS[collection_name])
+                logger.error(f"Error adding indexes on {collection_name}: {result}")
+            elif result:
+                failures += len(result)
+
+        if failures:
+            logger.warning(f"⚠️ {failures} indexes could not be created")
+        else:
+            logger.info("✅ All performance indexes added successfully!")
+
+        # Fetch all index lists concurrently; the full listing is only logged with --verify
+        all_indexes = await asyncio.gather(
+            *(db[c].list_indexes().to_list(None) for c in collection_names)
+        )
+        if verify:
+            logger.info("Current indexes:")
+        shadowed_found = {}
+        for collection_name, indexes in zip(collection_names, all_indexes):
+            if verify:
+                logger.info(f"{collection_name}: {len(indexes)} indexes")
+                for idx in indexes:
+                    logger.info(f"  - {idx.get('name', 'unnamed')}: {idx.get('key', {})}")
+            shadowed = find_shadowed_indexes(indexes)
+            if shadowed:
+                shadowed_found[collection_name] = shadowed
+
+        if shadowed_found:
+            for collection_name, names in shadowed_found.items():
+                logger.error(
+                    f"❌ {collection_name} has prefix-shadowed indexes: {', '.join(names)} "
+                    f"(drop them with db.{collection_name}.dropIndex(<name>))"
+                )
+            raise RuntimeError(f"Prefix-shadowed indexes present: {shadowed_found}")
 
     except Exception as e:
         logger.error(f"Error adding indexes: {e}")
@@ -87,4 +273,4 @@ async def add_performance_indexes():
         client.close()
 
 if __name__ == "__main__":
-    asyncio.run(add_performance_indexes())
\ No newline at end of file
+    asyncio.run(add_performance_indexes(verify="--verify" in sys.argv))
@@ -1,22 +1,65 @@
 # app/agents/__init___fixed.py
 from langgraph.graph import StateGraph, END
+from pydantic import BaseModel
 from app.agents.state import FormState
 from app.agents.enhanced_form_filler_agent import EnhancedFormFillerAgent
 from app.agents.enhanced_form_predictor_node import EnhancedFormPredictorNode
-from app.sessions.session_manager import SessionManager, SessionData, SessionState
+from app.sessions.session_manager import SessionManager, SessionState, session_state_value
 from app.utils.observability import ObservabilityMixin, monitor
 from app.database import db
 from app.utils.langchain_utils import get_gemini_llm
 from app.utils.confidence_system import ConfidenceManager
-import httpx
 import logging
-from datetime import datetime
-from app.config.settings import settings
+import re
+import time
+from typing import Optional
 from app.agents.form_searcher_node import FormSearcherNode
 from app.agents.report_generator_node import ReportGeneratorNode
+from app.agents.routing import DEFAULT_FORM_STATE, ROUTER_EDGES, PREDICTOR_ROUTE_TABLE, has_form_template_id
 
 logger = logging.getLogger(__name__)
 
+# Classified intent -> graph node
+_INTENT_MAPPING = {
+    "fill_form": "form_predictor",
+    "search_forms": "form_searcher",
+    "generate_report": "report_generator",
+    "clarification_needed": "clarification_handler",
+}
+
+# Intent classification cache: normalized user message -> intent
+_INTENT_CACHE_MAX_SIZE = 1024
+_INTENT_CACHE = {}
+
+# Keyword prefilter checked before falling back to the LLM classifier.
+# Only unambiguous stems are listed: nouns like "report" or "form" and openers
+# like "show me" appear in messages of every intent ("help me with the safety
+# report", "show me analytics"), so those are left to the cached LLM path.
+_INTENT_RE = re.compile(
+    r"\b(?:"
+    r"(?P<search>search|find|buscar|busca|procur)"
+    r"|(?P<report>summary|resumo|analytics|an[áa]lise)"
+    r"|(?P<fill>fill|preench)"
+    r")",
+    re.IGNORECASE,
+)
+
+_INTENT_RE_GROUPS = {
+    "search": "search_forms",
+    "report": "generate_report",
+    "fill": "fill_form",
+}
+
+
+def _keyword_intent(user_message):
+    """Return the intent matched by the keyword prefilter, or None if ambiguous."""
+    groups = {match.lastgroup for match in _INTENT_RE.finditer(user_message)}
+    # Keywords of several intents ("find the summary") are for the classifier to weigh
+    if len(groups) == 1:
+        return _INTENT_RE_GROUPS[groups.pop()]
+    return None
+
+
 def _state_get(state, key, default=None):
     """
     Safely get a value from LangGraph state with enhanced error handling.
@@ -24,32 +67,22 @@ def _state_get(state, key, default=None):
     """
     if state is None:
         return default
-    
-    # Handle Pydantic models (both v1 and v2)
-    if hasattr(state, "model_dump"):  # Pydantic v2
-        try:
-            state_dict = state.model_dump()
-            return state_dict.get(key, default)
-        except Exception:
-            pass
-    elif hasattr(state, "dict"):  # Pydantic v1
-        try:
-            state_dict = state.dict()
-            return state_dict.get(key, default)
-        except Exception:
-            pass
-    
+
     # Handle regular dictionaries
     if isinstance(state, dict):
         return state.get(key, default)
-    
+
+    # Pydantic model fields are plain attributes - no need to dump the whole model
+    if isinstance(state, BaseModel):
+        return getattr(state, key, default)
+
     # Handle objects with __getitem__ method (like some LangGraph states)
     if hasattr(state, "__getitem__"):
         try:
             return state[key]
         except (KeyError, TypeError):
             pass
-    
+
     # Try .get method for dict-like objects
     getter = getattr(state, "get", None)
     if callable(getter):
@@ -57,15 +90,40 @@ def _state_get(state, key, default=None):
             return getter(key, default)
         except (TypeError, AttributeError):
             pass
-    
+
     # Try attribute access as fallback
-    try:
-        return getattr(state, key, default)
-    except AttributeError:
-        pass
-    
-    # Finally return default
-    return default
+    return getattr(state, key, default)
+
+
+# State keys read by the nodes below, used when a state object can't be
+# converted to a dict directly
+_KNOWN_FORM_STATE_KEYS = (
+    "session_id", "user_id", "user_message", "form_template_id", "session_state",
+    "confidence_score", "requires_clarification", "clarification_message",
+    "reasoning", "form_details", "error_message", "next_node", "final_response",
+)
+
+_MISSING = object()
+
+
+def _state_dict(state):
+    """
+    Return a shallow dict view of the state so nodes read it once and then use
+    plain .get() lookups. Dicts are returned as-is; Pydantic models are
+    converted field by field without recursing into nested values.
+    """
+    if state is None:
+        return {}
+    if isinstance(state, dict):
+        return state
+    if isinstance(state, BaseModel):
+        return dict(state)
+    values = {}
+    for key in _KNOWN_FORM_STATE_KEYS:
+        value = _state_get(state, key, _MISSING)
+        if value is not _MISSING:
+            values[key] = value
+    return values
 
 
 class EnhancedRouterNode(ObservabilityMixin):
@@ -78,11 +136,12 @@ class EnhancedRouterNode(ObservabilityMixin):
     async def run(self, state: FormState):
         """Enhanced routing with optimized first message handling."""
         try:
-            user_message = _state_get(state, "user_message")
-            session_id = _state_get(state, "session_id")
-            session_state = _state_get(state, "session_state", "STARTING")
+            state_values = _state_dict(state)
+            user_message = state_values.get("user_message")
+            session_id = state_values.get("session_id")
+            session_state = state_values.get("session_state", "STARTING")
 
-            logger.info(f"Router processing message: '{user_message}' for session: {session_id}, state: {session_state}")
+            logger.info("Router processing message: '%s' for session: %s, state: %s", user_message, session_id, session_state)
 
             if not user_message:
                 logger.info("No user message found, routing to form predictor")
@@ -92,17 +151,13 @@ class EnhancedRouterNode(ObservabilityMixin):
             session_data = await self._get_session_data(session_id)
             if session_data and hasattr(session_data, 'form_template_id') and session_data.form_template_id:
                 # Check if session is completed
-                session_state = getattr(session_data, 'state', None)
-                if hasattr(session_state, 'value'):
-                    state_value = session_state.value
-                else:
-                    state_value = str(session_state) if session_state else None
+                state_value = session_state_value(getattr(session_data, 'state', None))
 
                 if state_value == "COMPLETED":
-                    logger.info(f"Session {session_id} is completed, routing to form predictor for new request")
+                    logger.info("Session %s is completed, routing to form predictor for new request", session_id)
                     return {"next_node": "form_predictor"}
                 else:
-                    logger.info(f"Continuing existing form session with template: {session_data.form_template_id}, state: {state_value}")
+                    logger.info("Continuing existing form session with template: %s, state: %s", session_data.form_template_id, state_value)
                     return {"next_node": "form_filler"}
 
             # Optimization: Skip intent classification for first messages
@@ -113,26 +168,39 @@ class EnhancedRouterNode(ObservabilityMixin):
 
             # Enhanced intent classification only for subsequent messages
             intent = await self._classify_intent(user_message)
-            logger.info(f"Classified intent: '{intent}' for message: '{user_message}'")
-
-            intent_mapping = {
-                "fill_form": "form_predictor",
-                "search_forms": "form_searcher",
-                "generate_report": "report_generator",
-                "clarification_needed": "clarification_handler"
-            }
+            logger.info("Classified intent: '%s' for message: '%s'", intent, user_message)
 
-            next_node = intent_mapping.get(intent, "form_predictor")
-            logger.info(f"Routing to node: {next_node}")
+            next_node = _INTENT_MAPPING.get(intent, "form_predictor")
+            logger.info("Routing to node: %s", next_node)
 
             return {"next_node": next_node}
 
         except Exception as e:
-            logger.exception(f"Error in router node: {e}")
+            logger.exception("Error in router node: %s", e)
             return {"next_node": "error", "error_message": f"Router error: {str(e)}"}
 
     async def _classify_intent(self, user_message: str) -> str:
-        """Enhanced intent classification with better prompting."""
+        """Classify intent via keyword prefilter and cache, using the LLM only for ambiguous messages."""
+        normalized_message = " ".join(user_message.lower().split())
+
+        intent = _keyword_intent(normalized_message)
+        if intent:
+            return intent
+
+        cached_intent = _INTENT_CACHE.get(normalized_message)
+        if cached_intent:
+            return cached_intent
+
+        intent = await self._classify_intent_with_llm(user_message)
+        if intent is not None:
+            if len(_INTENT_CACHE) >= _INTENT_CACHE_MAX_SIZE:
+                _INTENT_CACHE.pop(next(iter(_INTENT_CACHE)))
+            _INTENT_CACHE[normalized_message] = intent
+            return intent
+        return "fill_form"  # Safe default
+
+    async def _classify_intent_with_llm(self, user_message: str) -> Optional[str]:
+        """Enhanced intent classification with better prompting. Returns None on LLM failure."""
         prompt = f"""You are an expert at classifying user intents for a form management system.
 
 Based on the user's message, classify the intent into one of the following categories:
@@ -169,16 +237,16 @@ Respond with ONLY the category name (fill_form, search_forms, generate_report, o
                 return "clarification_needed"
                 
         except Exception as e:
-            logger.error(f"Error classifying intent: {e}")
-            return "fill_form"  # Safe default
+            logger.error("Error classifying intent: %s", e)
+            return None
 
     async def _get_session_data(self, session_id):
         """Get session data with enhanced error handling."""
         if self.session_manager and session_id:
             try:
-                return await self.session_manager.get_session(session_id)
+                return await self.session_manager.get_cached_session(session_id)
             except Exception as e:
-                logger.error(f"Error retrieving session data: {e}")
+                logger.error("Error retrieving session data: %s", e)
                 return None
         return None
 
@@ -192,7 +260,7 @@ class ClarificationHandlerNode(ObservabilityMixin):
     async def run(self, state: FormState):
         """Generate clarification response with context awareness."""
         try:
-            user_message = _state_get(state, "user_message", "")
+            user_message = _state_dict(state).get("user_message", "")
             
             # Generate contextual clarification message
             clarification_message = f"""Quero ajudá-lo, mas preciso de mais clareza sobre sua solicitação: "{user_message}"
@@ -213,7 +281,7 @@ Você pode me dizer qual destes você gostaria de fazer, ou fornecer mais detalh
             }
             
         except Exception as e:
-            logger.exception(f"Error in clarification handler: {e}")
+            logger.exception("Error in clarification handler: %s", e)
             return {
                 "final_response": "Preciso de mais informações para ajudá-lo. Você poderia esclarecer o que está procurando?",
                 "is_complete": False,
@@ -230,20 +298,21 @@ class EnhancedFormFillerNode(ObservabilityMixin):
     async def run(self, state: FormState):
         """Enhanced form filling with comprehensive error handling."""
         try:
-            session_id = _state_get(state, "session_id")
-            user_message = _state_get(state, "user_message")
-            predicted_form_id = _state_get(state, "form_template_id")
+            state_values = _state_dict(state)
+            session_id = state_values.get("session_id")
+            user_message = state_values.get("user_message")
+            predicted_form_id = state_values.get("form_template_id")
             
-            logger.info(f"Form filler processing session: {session_id}, form: {predicted_form_id}")
+            logger.info("Form filler processing session: %s, form: %s", session_id, predicted_form_id)
             
             # Handle prediction confidence and clarification
-            confidence_score = _state_get(state, "confidence_score", 1.0)
-            requires_clarification = _state_get(state, "requires_clarification", False)
-            clarification_message = _state_get(state, "clarification_message")
+            confidence_score = state_values.get("confidence_score", 1.0)
+            requires_clarification = state_values.get("requires_clarification", False)
+            clarification_message = state_values.get("clarification_message")
             
             # Return clarification if needed
             if requires_clarification and clarification_message:
-                logger.info(f"Returning clarification for session {session_id}")
+                logger.info("Returning clarification for session %s", session_id)
                 return {
                     "final_response": clarification_message,
                     "is_complete": False,
@@ -254,7 +323,7 @@ class EnhancedFormFillerNode(ObservabilityMixin):
             # Get session data
             session_data = await self.session_manager.get_session(session_id)
             if not session_data:
-                logger.error(f"Session {session_id} not found in form filler")
+                logger.error("Session %s not found in form filler", session_id)
                 return {
                     "final_response": "I couldn't find your session. Let's start fresh - what kind of form do you need help with?",
                     "is_complete": False,
@@ -264,23 +333,23 @@ class EnhancedFormFillerNode(ObservabilityMixin):
             # Set predicted form ID if available
             if predicted_form_id and not getattr(session_data, "form_template_id", None):
                 session_data.form_template_id = predicted_form_id
-                logger.info(f"Set form template ID: {predicted_form_id} for session {session_id}")
+                logger.info("Set form template ID: %s for session %s", predicted_form_id, session_id)
                 
                 # Log prediction metadata
-                reasoning = _state_get(state, "reasoning")
-                form_details = _state_get(state, "form_details", {})
+                reasoning = state_values.get("reasoning")
+                form_details = state_values.get("form_details", {})
                 
                 if reasoning:
-                    logger.info(f"Form prediction reasoning: {reasoning}")
+                    logger.info("Form prediction reasoning: %s", reasoning)
                 if form_details:
                     form_title = form_details.get('title', 'Unknown Form')
-                    logger.info(f"Starting form: {form_title}")
+                    logger.info("Starting form: %s", form_title)
 
             # Validate form template ID
             if not getattr(session_data, "form_template_id", None):
-                error_message = _state_get(state, "error_message", 
+                error_message = state_values.get("error_message", 
                     "I'm not sure which form you'd like to fill out. Could you please be more specific?")
-                logger.warning(f"No form template ID for session {session_id}")
+                logger.warning("No form template ID for session %s", session_id)
                 return {
                     "final_response": error_message,
                     "is_complete": False,
@@ -291,35 +360,19 @@ class EnhancedFormFillerNode(ObservabilityMixin):
             agent = EnhancedFormFillerAgent(db, session_data)
 
             # Process the interaction based on session state
-            if getattr(session_data, "state", None) == SessionState.STARTING or session_data.state == "STARTING":
-                logger.info(f"Starting new form conversation for session {session_id}")
+            if session_data.state == SessionState.STARTING:
+                logger.info("Starting new form conversation for session %s", session_id)
 
                 # ENHANCED: Check if user provided data in their first message
-                user_message_content = _state_get(state, "user_message", "").strip()
+                user_message_content = (user_message or "").strip()
                 if user_message_content and len(user_message_content) > 10:  # More than just a greeting
-                    logger.info(f"User provided data in first message, processing with extraction: {user_message_content}")
-                    # Start conversation then immediately process the user's message
-                    response = await agent.start_conversation()
-
-                    # If start_conversation succeeded, process the user's message for field extraction
-                    if response.get("is_complete") is False:  # Form started successfully
-                        extraction_response = await agent.process_message(user_message_content)
-                        # Merge the responses - show welcome + extraction results
-                        welcome_msg = response.get("message", "")
-                        extraction_msg = extraction_response.get("message", "")
-
-                        if extraction_msg and "Informações capturadas" in extraction_msg:
-                            # User provided useful data, combine messages
-                            combined_msg = f"{welcome_msg}\n\n{extraction_msg}"
-                            response["message"] = combined_msg
-                        else:
-                            # No useful data extracted, just show the welcome + current question
-                            response = extraction_response
+                    logger.info("User provided data in first message, processing with extraction: %s", user_message_content)
+                    response = await agent.start_and_process(user_message_content)
                 else:
                     # Standard start conversation
                     response = await agent.start_conversation()
             else:
-                logger.info(f"Processing message for ongoing session {session_id}")
+                logger.info("Processing message for ongoing session %s", session_id)
                 response = await agent.process_message(user_message)
 
             # Save updated session
@@ -332,19 +385,19 @@ class EnhancedFormFillerNode(ObservabilityMixin):
                 "confidence_score": confidence_score,
                 "chat_history": agent.session_data.conversation_history,
                 "responses_count": len(agent.session_data.responses),
-                "session_state": agent.session_data.state.value if isinstance(agent.session_data.state, SessionState) else agent.session_data.state
+                "session_state": agent.session_data.state.value
             }
             
             # Ensure we have a response message
             if not final_response["final_response"]:
-                logger.warning(f"Empty response from agent for session {session_id}")
+                logger.warning("Empty response from agent for session %s", session_id)
                 final_response["final_response"] = "I'm processing your request. Could you provide more details?"
             
-            logger.info(f"Form filler completed for session {session_id}, complete: {final_response['is_complete']}")
+            logger.info("Form filler completed for session %s, complete: %s", session_id, final_response['is_complete'])
             return final_response
             
         except Exception as e:
-            logger.exception(f"Error in form filler node: {e}")
+            logger.exception("Error in form filler node: %s", e)
             return {
                 "final_response": f"I encountered an issue while processing the form: {str(e)}. Please try again.",
                 "is_complete": False,
@@ -358,10 +411,11 @@ class ErrorNode(ObservabilityMixin):
     async def run(self, state: FormState):
         """Handle errors with contextual messages."""
         try:
-            error_message = _state_get(state, "error_message")
-            session_id = _state_get(state, "session_id")
+            state_values = _state_dict(state)
+            error_message = state_values.get("error_message")
+            session_id = state_values.get("session_id")
             
-            logger.error(f"Error node activated for session {session_id}: {error_message}")
+            logger.error("Error node activated for session %s: %s", session_id, error_message)
             
             if not error_message:
                 error_message = "An unexpected error occurred. Please try rephrasing your request."
@@ -385,7 +439,7 @@ What would you like to try?"""
             }
             
         except Exception as e:
-            logger.exception(f"Error in error node: {e}")
+            logger.exception("Error in error node: %s", e)
             return {
                 "final_response": "I'm experiencing technical difficulties. Please try again later.",
                 "is_complete": True,
@@ -430,46 +484,37 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
         # Enhanced router conditional edges with error handling
         def router_decision(state):
             try:
-                next_node = _state_get(state, "next_node", "error")
-                logger.debug(f"Router decision: {next_node}")
-                return next_node
+                next_node = _state_dict(state).get("next_node", "error")
+                logger.debug("Router decision: %s", next_node)
+                return next_node if next_node in ROUTER_EDGES else "error"
             except Exception as e:
-                logger.error(f"Error in router decision: {e}")
+                logger.error("Error in router decision: %s", e)
                 return "error"
 
         workflow.add_conditional_edges(
             "router",
             router_decision,
-            {
-                "form_predictor": "form_predictor",
-                "form_filler": "form_filler",
-                "clarification_handler": "clarification_handler",
-                "form_searcher": "form_searcher",
-                "report_generator": "report_generator",
-                "error": "error",
-            },
+            ROUTER_EDGES,
         )
 
         # Enhanced form predictor conditional edges
         def form_predictor_router(state):
             try:
-                form_template_id = _state_get(state, "form_template_id")
-                error_message = _state_get(state, "error_message")
-                requires_clarification = _state_get(state, "requires_clarification", False)
+                state_values = _state_dict(state)
+                form_template_id = state_values.get("form_template_id")
+                error_message = state_values.get("error_message")
+                requires_clarification = state_values.get("requires_clarification", False)
                 
-                logger.debug(f"Form predictor router - form_id: {form_template_id}, error: {error_message}, clarification: {requires_clarification}")
+                logger.debug("Form predictor router - form_id: %s, error: %s, clarification: %s", form_template_id, error_message, requires_clarification)
                 
-                if error_message:
-                    return "error"
-                elif requires_clarification:
-                    return "form_filler"  # Form filler can handle clarification
-                elif form_template_id is not None and str(form_template_id).strip() != "":
-                    return "form_filler"
-                else:
-                    return "error"
-                    
+                return PREDICTOR_ROUTE_TABLE[(
+                    bool(error_message),
+                    bool(requires_clarification),
+                    has_form_template_id(form_template_id),
+                )]
+
             except Exception as e:
-                logger.error(f"Error in form predictor router: {e}")
+                logger.error("Error in form predictor router: %s", e)
                 return "error"
 
         workflow.add_conditional_edges(
@@ -496,24 +541,20 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
         session_id = initial_state.get("session_id", "unknown")
         
         try:
-            logger.info(f"Starting graph execution for session {session_id}")
-            logger.debug(f"Initial state keys: {list(initial_state.keys())}")
+            logger.info("Starting graph execution for session %s", session_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Initial state keys: %s", list(initial_state.keys()))
             
             # Ensure required state fields are present with proper defaults
             enhanced_state = {
-                "initial_confidence_score": 1.0,
-                "confidence_level": "high",
-                "timestamp": datetime.utcnow().isoformat(),
-                "current_field": None,
+                **DEFAULT_FORM_STATE,
+                # Epoch seconds; format at the sink if an ISO string is ever needed
+                "timestamp": time.time(),
+                # Mutable defaults are created per invocation so runs never share them
                 "responses": {},
                 "completed_fields": [],
                 "missing_required_fields": [],
                 "chat_history": [],
-                "state": "STARTING",
-                "is_complete": False,
-                "final_response": None,
-                "error_message": None,
-                "next_node": None,
                 **initial_state
             }
             
@@ -521,7 +562,7 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
             final_state = await self.graph.ainvoke(enhanced_state)
             
             if not final_state:
-                logger.error(f"Graph returned None state for session {session_id}")
+                logger.error("Graph returned None state for session %s", session_id)
                 return {
                     "final_response": "I encountered an issue processing your request. Please try again.",
                     "is_complete": False,
@@ -530,7 +571,7 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
             
             # Validate final state has required fields
             if not _state_get(final_state, "final_response"):
-                logger.warning(f"No final_response in final state for session {session_id}")
+                logger.warning("No final_response in final state for session %s", session_id)
                 # Try to extract from other possible fields
                 response = (
                     _state_get(final_state, "message") or 
@@ -540,11 +581,11 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
                 )
                 final_state["final_response"] = response
             
-            logger.info(f"Graph execution completed successfully for session {session_id}")
+            logger.info("Graph execution completed successfully for session %s", session_id)
             return final_state
             
         except Exception as e:
-            logger.exception(f"Graph execution failed for session {session_id}: {e}")
+            logger.exception("Graph execution failed for session %s: %s", session_id, e)
             return {
                 "final_response": "I encountered an unexpected error while processing your request. Please try again, and contact support if the problem persists.",
                 "is_complete": False,
@@ -3,6 +3,6 @@ Base classes and utilities for agent nodes.
 """
 
 from .node import BaseNode
-from .utils import state_get, state_set
+from .utils import state_get, state_get_many, state_set
 
-__all__ = ['BaseNode', 'state_get', 'state_set']
\ No newline at end of file
+__all__ = ['BaseNode', 'state_get', 'state_get_many', 'state_set']
\ No newline at end of file
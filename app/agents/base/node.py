@@ -3,14 +3,29 @@ Base node class for all agent nodes.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from dataclasses import fields
+import functools
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, get_type_hints
 import logging
-from datetime import datetime
+import time
 
 from ..types import StateType, ResponseType, NodeResponse, NodeType
-from .utils import state_get, state_set
+from .utils import state_get_many, state_set, validate_state_keys
 from app.utils.observability import ObservabilityMixin
 
+# Keys a node response dict may carry into NodeResponse; anything else is dropped
+_RESPONSE_FIELDS = frozenset(f.name for f in fields(NodeResponse))
+
+
+@functools.lru_cache(maxsize=64)
+def _error_template(name: str) -> Dict[str, Any]:
+    """Fixed part of a node's error response; only error_message varies per call."""
+    return {
+        "final_response": f"Ocorreu um erro no nó {name}. Por favor, tente novamente.",
+        "next_node": "error",
+        "is_complete": False,
+    }
+
 
 class BaseNode(ObservabilityMixin, ABC):
     """
@@ -18,6 +33,24 @@ class BaseNode(ObservabilityMixin, ABC):
     Provides common functionality and enforces consistent interface.
     """
 
+    # The "logger" slot shadows ObservabilityMixin's lazy property with a plain attribute
+    __slots__ = ("node_type", "name", "logger")
+
+    # State keys that must be present; subclasses override the class attribute
+    REQUIRED_STATE_KEYS: ClassVar[FrozenSet[str]] = frozenset({"session_id", "user_message"})
+
+    # Whether execute() may return a plain dict that run() must wrap in NodeResponse.
+    # Resolved per subclass from execute()'s return annotation.
+    _WRAPS_DICT_RESPONSES: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        try:
+            returns = get_type_hints(cls.execute).get("return")
+        except Exception:
+            returns = None
+        cls._WRAPS_DICT_RESPONSES = returns is not NodeResponse
+
     def __init__(self, node_type: NodeType, name: Optional[str] = None):
         """
         Initialize base node.
@@ -27,6 +60,7 @@ class BaseNode(ObservabilityMixin, ABC):
             name: Optional name for the node
         """
         super().__init__()
+        self.logger = logging.getLogger(self.__class__.__name__)
         self.node_type = node_type
         self.name = name or node_type.value
 
@@ -53,45 +87,42 @@ class BaseNode(ObservabilityMixin, ABC):
         Returns:
             Response object or dictionary
         """
-        session_id = state_get(state, "session_id", "unknown")
-        self.logger.info(f"🔍 BASE_NODE: Starting {self.name} node for session {session_id}")
+        session_id, user_message = state_get_many(
+            state, ("session_id", "user_message"), ("unknown", None)
+        )
+        self.logger.debug("🔍 BASE_NODE: Starting %s node for session %s", self.name, session_id)
 
         try:
-            # Debug: Log state structure
-            self.logger.info(f"🔍 BASE_NODE: State type: {type(state)}")
-            if hasattr(state, '__dict__'):
-                state_keys = list(state.__dict__.keys())
-                self.logger.info(f"🔍 BASE_NODE: State.__dict__ keys: {state_keys}")
-            elif hasattr(state, 'keys'):
-                state_keys = list(state.keys())
-                self.logger.info(f"🔍 BASE_NODE: State.keys(): {state_keys}")
-            else:
-                self.logger.info(f"🔍 BASE_NODE: State has no keys method")
-
-            # Try to get specific values
-            user_message = state_get(state, "user_message")
-            session_id_val = state_get(state, "session_id")
-            self.logger.info(f"🔍 BASE_NODE: user_message='{user_message}', session_id='{session_id_val}'")
-        except Exception as e:
-            self.logger.info(f"🔍 BASE_NODE: Could not analyze state: {e}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                # Debug: Log state structure
+                self.logger.debug("🔍 BASE_NODE: State type: %s", type(state))
+                if hasattr(state, '__dict__'):
+                    # Pass key views; they are only rendered if a handler emits the record
+                    self.logger.debug("🔍 BASE_NODE: State.__dict__ keys: %s", state.__dict__.keys())
+                elif hasattr(state, 'keys'):
+                    self.logger.debug("🔍 BASE_NODE: State.keys(): %s", state.keys())
+                else:
+                    self.logger.debug("🔍 BASE_NODE: State has no keys method")
+                self.logger.debug(
+                    "🔍 BASE_NODE: user_message='%s', session_id='%s'",
+                    user_message, session_id,
+                )
 
-        try:
             # Add execution metadata to state
-            state_set(state, "_node_execution_start", datetime.utcnow().isoformat())
+            state_set(state, "_node_execution_start_ns", time.monotonic_ns())
             state_set(state, "_current_node", self.name)
 
             # Execute the node logic
             response = await self.execute(state)
 
-            # Ensure response is in correct format
-            if isinstance(response, dict):
+            # Nodes whose execute() is annotated "-> NodeResponse" skip the dict check
+            if self._WRAPS_DICT_RESPONSES and isinstance(response, dict):
                 # Convert dict to NodeResponse for consistency
                 return self._ensure_response_format(response)
-            else:
-                return response
+            return response
 
         except Exception as e:
-            self.logger.exception(f"Error in {self.name} node: {e}")
+            self.logger.exception("Error in %s node: %s", self.name, e)
             return self._create_error_response(str(e))
 
     def _ensure_response_format(self, response: Dict[str, Any]) -> NodeResponse:
@@ -104,19 +135,8 @@ class BaseNode(ObservabilityMixin, ABC):
         Returns:
             NodeResponse object
         """
-        return NodeResponse(
-            final_response=response.get("final_response"),
-            next_node=response.get("next_node"),
-            is_complete=response.get("is_complete", False),
-            confidence_score=response.get("confidence_score"),
-            error_message=response.get("error_message"),
-            requires_clarification=response.get("requires_clarification", False),
-            form_template_id=response.get("form_template_id"),
-            reasoning=response.get("reasoning"),
-            session_state=response.get("session_state"),
-            chat_history=response.get("chat_history"),
-            responses_count=response.get("responses_count", 0)
-        )
+        # Missing keys take the dataclass defaults
+        return NodeResponse(**{k: v for k, v in response.items() if k in _RESPONSE_FIELDS})
 
     def _create_error_response(self, error_message: str) -> NodeResponse:
         """
@@ -128,22 +148,7 @@ class BaseNode(ObservabilityMixin, ABC):
         Returns:
             Error response
         """
-        return NodeResponse(
-            final_response=f"Ocorreu um erro no nó {self.name}. Por favor, tente novamente.",
-            next_node="error",
-            is_complete=False,
-            error_message=error_message
-        )
-
-    def _get_required_state_keys(self) -> list:
-        """
-        Get list of required state keys for this node.
-        Override in subclasses to specify required keys.
-
-        Returns:
-            List of required state keys
-        """
-        return ["session_id", "user_message"]
+        return NodeResponse(**_error_template(self.name), error_message=error_message)
 
     def _validate_state(self, state: StateType) -> tuple[bool, list]:
         """
@@ -155,14 +160,7 @@ class BaseNode(ObservabilityMixin, ABC):
         Returns:
             Tuple of (is_valid, missing_keys)
         """
-        required_keys = self._get_required_state_keys()
-        missing_keys = []
-
-        for key in required_keys:
-            if state_get(state, key) is None:
-                missing_keys.append(key)
-
-        return len(missing_keys) == 0, missing_keys
+        return validate_state_keys(state, self.REQUIRED_STATE_KEYS)
 
     def _log_state_info(self, state: StateType) -> None:
         """
@@ -171,12 +169,11 @@ class BaseNode(ObservabilityMixin, ABC):
         Args:
             state: Current state
         """
-        session_id = state_get(state, "session_id", "unknown")
-        user_message = state_get(state, "user_message", "")
-        session_state = state_get(state, "session_state", "unknown")
+        session_id, user_message, session_state = state_get_many(
+            state, ("session_id", "user_message", "session_state"), ("unknown", "", "unknown")
+        )
 
         self.logger.debug(
-            f"Node {self.name} - Session: {session_id}, "
-            f"State: {session_state}, "
-            f"Message length: {len(user_message) if user_message else 0}"
+            "Node %s - Session: %s, State: %s, Message length: %d",
+            self.name, session_id, session_state, len(user_message) if user_message else 0,
         )
\ No newline at end of file
@@ -2,17 +2,82 @@
 Utility functions for state management and common operations.
 """
 
-from typing import Any, Union
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
 import logging
+import operator
+import weakref
 from ..types import StateType
 
 logger = logging.getLogger(__name__)
 
+# State class -> accessor specialised for it. Keyed weakly so dynamically
+# generated LangGraph state classes can still be collected.
+_GETTER_CACHE: "weakref.WeakKeyDictionary[type, Callable[[Any, str, Any], Any]]" = weakref.WeakKeyDictionary()
+_SETTER_CACHE: "weakref.WeakKeyDictionary[type, Callable[[Any, str, Any], None]]" = weakref.WeakKeyDictionary()
+
+
+def _get_via_get(state: Any, key: str, default: Any) -> Any:
+    try:
+        return state.get(key, default)
+    except (TypeError, AttributeError):
+        return getattr(state, key, default)
+
+
+def _get_item(state: Any, key: str, default: Any) -> Any:
+    try:
+        return state[key]
+    except (KeyError, TypeError):
+        pass
+    if callable(getattr(state, "get", None)):
+        return _get_via_get(state, key, default)
+    return getattr(state, key, default)
+
+
+_MISSING = object()
+
+
+def _get_model_field(state: Any, key: str, default: Any) -> Any:
+    # Fields live in the instance __dict__; getattr covers computed fields,
+    # properties and extras without serializing the whole model.
+    value = state.__dict__.get(key, _MISSING)
+    if value is _MISSING:
+        return getattr(state, key, default)
+    return value
+
+
+def _resolve_getter(state_type: type) -> Callable[[Any, str, Any], Any]:
+    """Pick the access strategy for a state class, probing it only once."""
+    if issubclass(state_type, dict):
+        return dict.get
+    if hasattr(state_type, "model_dump") or hasattr(state_type, "dict"):  # Pydantic v2 / v1
+        return _get_model_field
+    if hasattr(state_type, "__getitem__"):
+        return _get_item
+    if callable(getattr(state_type, "get", None)):
+        return _get_via_get
+    # getattr with a default never raises AttributeError, so the builtin is the accessor
+    return getattr
+
+
+def _getter_for(state_type: type) -> Callable[[Any, str, Any], Any]:
+    getter = _GETTER_CACHE.get(state_type)
+    if getter is None:
+        getter = _GETTER_CACHE[state_type] = _resolve_getter(state_type)
+    return getter
+
+
+def _resolve_setter(state_type: type) -> Callable[[Any, str, Any], None]:
+    # Every object has __setattr__, so only item assignment needs probing
+    if hasattr(state_type, "__setitem__"):
+        return operator.setitem
+    return setattr
+
 
 def state_get(state: StateType, key: str, default: Any = None) -> Any:
     """
     Safely get a value from LangGraph state with enhanced error handling.
     Handles various state object types including dictionaries, Pydantic models, and custom objects.
+    The access strategy is resolved once per state class and cached.
 
     Args:
         state: State object (dict, Pydantic model, or custom object)
@@ -24,48 +89,37 @@ def state_get(state: StateType, key: str, default: Any = None) -> Any:
     """
     if state is None:
         return default
-
-    # Handle Pydantic models (both v1 and v2)
-    if hasattr(state, "model_dump"):  # Pydantic v2
-        try:
-            state_dict = state.model_dump()
-            return state_dict.get(key, default)
-        except Exception:
-            pass
-    elif hasattr(state, "dict"):  # Pydantic v1
-        try:
-            state_dict = state.dict()
-            return state_dict.get(key, default)
-        except Exception:
-            pass
-
-    # Handle regular dictionaries
+    # Plain dict states are the common case; skip the strategy cache entirely
     if isinstance(state, dict):
         return state.get(key, default)
 
-    # Handle objects with __getitem__ method (like some LangGraph states)
-    if hasattr(state, "__getitem__"):
-        try:
-            return state[key]
-        except (KeyError, TypeError):
-            pass
-
-    # Try .get method for dict-like objects
-    getter = getattr(state, "get", None)
-    if callable(getter):
-        try:
-            return getter(key, default)
-        except (TypeError, AttributeError):
-            pass
-
-    # Try attribute access as fallback
-    try:
-        return getattr(state, key, default)
-    except AttributeError:
-        pass
+    return _getter_for(type(state))(state, key, default)
+
+
+def state_get_many(
+    state: StateType, keys: Sequence[str], defaults: Optional[Sequence[Any]] = None
+) -> tuple:
+    """
+    Read several keys from state, resolving the access strategy only once.
+
+    Args:
+        state: State object (dict, Pydantic model, or custom object)
+        keys: Keys to retrieve
+        defaults: Per-key defaults (same length as keys); None for all if omitted
+
+    Returns:
+        Tuple of values in the same order as keys
+    """
+    if defaults is None:
+        defaults = (None,) * len(keys)
+    if state is None:
+        return tuple(defaults)
+    if isinstance(state, dict):
+        get = state.get
+        return tuple(get(key, default) for key, default in zip(keys, defaults))
 
-    # Finally return default
-    return default
+    getter = _getter_for(type(state))
+    return tuple(getter(state, key, default) for key, default in zip(keys, defaults))
 
 
 def state_set(state: StateType, key: str, value: Any) -> bool:
@@ -82,48 +136,50 @@ def state_set(state: StateType, key: str, value: Any) -> bool:
     """
     if state is None:
         return False
+    if isinstance(state, dict):
+        state[key] = value
+        return True
 
-    try:
-        # Handle dictionary-like objects
-        if hasattr(state, "__setitem__"):
-            state[key] = value
-            return True
-
-        # Handle attribute setting
-        if hasattr(state, "__setattr__"):
-            setattr(state, key, value)
-            return True
-
-        return False
+    state_type = type(state)
+    setter = _SETTER_CACHE.get(state_type)
+    if setter is None:
+        setter = _SETTER_CACHE[state_type] = _resolve_setter(state_type)
 
+    try:
+        setter(state, key, value)
+        return True
     except Exception as e:
         logger.warning(f"Failed to set state key {key}: {e}")
         return False
 
 
-def validate_state_keys(state: StateType, required_keys: list) -> tuple[bool, list]:
+def validate_state_keys(state: StateType, required_keys: Iterable[str]) -> tuple[bool, list]:
     """
     Validate that required keys exist in state.
 
     Args:
         state: State object to validate
-        required_keys: List of required keys
+        required_keys: Required keys (any iterable)
 
     Returns:
         Tuple of (is_valid, missing_keys)
     """
-    missing_keys = []
-
-    for key in required_keys:
-        if state_get(state, key) is None:
-            missing_keys.append(key)
-
-    return len(missing_keys) == 0, missing_keys
+    if isinstance(state, dict):
+        get = state.get
+        missing_keys = [key for key in required_keys if get(key) is None]
+    elif state is None:
+        missing_keys = list(required_keys)
+    else:
+        # Resolve the accessor once for all keys
+        getter = _getter_for(type(state))
+        missing_keys = [key for key in required_keys if getter(state, key, None) is None]
+    return not missing_keys, missing_keys
 
 
 def merge_states(primary: StateType, secondary: StateType) -> StateType:
     """
     Merge two state objects, with primary taking precedence.
+    Dicts are merged shallowly: values such as chat_history lists are shared, not copied.
 
     Args:
         primary: Primary state (takes precedence)
@@ -139,9 +195,7 @@ def merge_states(primary: StateType, secondary: StateType) -> StateType:
 
     # If both are dicts, merge them
     if isinstance(primary, dict) and isinstance(secondary, dict):
-        merged = secondary.copy()
-        merged.update(primary)
-        return merged
+        return {**secondary, **primary}
 
     # Otherwise, return primary
     return primary
\ No newline at end of file
@@ -1,17 +1,348 @@
 from bson import ObjectId
+from bson.errors import InvalidId
 from app.sessions.session_manager import EnhancedBaseAgent, SessionData
 from app.database import db
 from app.utils.langchain_utils import get_gemini_llm
 from app.config.settings import settings
+from app.utils.document_cache import get_cached_document, peek_cached_document, store_cached_document
+import asyncio
 import logging
-import json
+import orjson
 import re
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import string
+import time
+from itertools import islice
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple
 import httpx
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\+]')
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S")
+# get_interactive_suggestions never returns more than this
+_MAX_SUGGESTIONS = 3
+# Fixed suggestion sets for get_interactive_suggestions
+_EMAIL_DOMAINS = ("gmail.com", "yahoo.com", "outlook.com", "company.com")
+_EMAIL_EXAMPLES = ("user@gmail.com", "user@company.com")
+_PHONE_EXAMPLES = ("+1-555-123-4567", "(555) 123-4567", "555-123-4567")
+_NAME_EXAMPLES = ("John Doe", "Jane Smith", "[Your full name]")
+_COMPANY_EXAMPLES = ("Acme Corp", "Tech Solutions Inc", "[Your company name]")
+
+# Rule between the progress/acknowledgment block and the next question
+_QUESTION_SEPARATOR = "─" * 50
+# The skip path has always drawn its rule in ASCII
+_SKIP_QUESTION_SEPARATOR = "-" * 50
+# Closes the "form complete" message once the last field is answered
+_SUBMIT_PROMPT_FOOTER = (
+    "\n" + "═" * 40 + "\n"
+    "🚀 **PRONTO PARA ENVIAR?**\n"
+    "\n"
+    "✅ Digite **'sim'** ou **'enviar'** para finalizar\n"
+    "❌ Digite **'não'** para fazer alterações\n"
+    "📋 Digite **'revisar'** para ver detalhes"
+)
+# Every bar _create_progress_bar can draw at its default width, indexed by filled cells
+_PROGRESS_BAR_WIDTH = 20
+_PROGRESS_BARS = tuple("█" * i + "░" * (_PROGRESS_BAR_WIDTH - i) for i in range(_PROGRESS_BAR_WIDTH + 1))
+# Inserts that finish within this window get a single Redis write with the submission ID
+FAST_INSERT_TIMEOUT_SECONDS = 2.0
+
+# Boolean field answers (exact match after lower/strip)
+_BOOL_TRUE = frozenset({"yes", "y", "true", "1", "ok", "correct", "right",
+                        "sim", "s", "verdadeiro", "certo", "correto"})
+_BOOL_FALSE = frozenset({"no", "n", "false", "0", "wrong", "incorrect",
+                         "não", "nao", "falso", "errado", "incorreto"})
+
+
+def _substring_matcher(indicators) -> re.Pattern:
+    """One compiled alternation that finds any of the indicators as a substring in a single scan."""
+    return re.compile("|".join(re.escape(i) for i in sorted(indicators, key=len, reverse=True)))
+
+
+# Confirmation-step indicators (English and Portuguese), matched as substrings
+_CONFIRM_POSITIVE = frozenset({"yes", "y", "submit", "correct", "ok", "confirm", "sure", "right", "good",
+                               "looks good", "perfect", "sim", "s", "enviar", "submeter", "correto", "certo",
+                               "confirmar", "confirma", "perfeito", "bom"})
+_CONFIRM_NEGATIVE = frozenset({"no", "n", "wrong", "incorrect", "change", "edit", "fix", "not right", "modify",
+                               "não", "nao", "errado", "incorreto", "mudar", "alterar", "editar", "modificar"})
+_CONFIRM_REVIEW = frozenset({"review", "show", "check", "look", "see", "summary",
+                             "revisar", "mostrar", "verificar", "ver", "resumo"})
+_CONFIRM_POSITIVE_RE = _substring_matcher(_CONFIRM_POSITIVE)
+_CONFIRM_NEGATIVE_RE = _substring_matcher(_CONFIRM_NEGATIVE)
+_CONFIRM_REVIEW_RE = _substring_matcher(_CONFIRM_REVIEW)
+
+# Answers to "is this the right form?" when the form prediction had low confidence
+_FORM_PICK_POSITIVE = frozenset({"yes", "y", "ok", "correct", "right", "proceed", "continue"})
+_FORM_PICK_NEGATIVE = frozenset({"no", "n", "wrong", "different", "other"})
+_FORM_PICK_POSITIVE_RE = _substring_matcher(_FORM_PICK_POSITIVE)
+_FORM_PICK_NEGATIVE_RE = _substring_matcher(_FORM_PICK_NEGATIVE)
+
+# In-form commands: whole-message matches, except change requests which may appear anywhere
+_HELP_COMMANDS = frozenset({"help", "commands", "options"})
+_SKIP_COMMANDS = frozenset({"skip", "none", "n/a", "not applicable"})
+_SUMMARY_COMMANDS = frozenset({"summary", "review", "show", "what did i answer"})
+_CHANGE_COMMAND_RE = _substring_matcher({"change", "modify", "update"})
+
+# Fixed replies for help, confirmation and form-pick prompts
+_HELP_MESSAGE = """🆘 **Form Assistant Help**
+
+**📝 During Form Filling:**
+• Answer questions naturally - I'll validate your responses
+• Reply **'skip'** or **'none'** for optional fields
+• Reply **'summary'** or **'review'** to see your current answers
+• Reply **'change [field]'** to modify a previous answer
+
+**🎯 Available Commands:**
+• **'help'** - Show this help message
+• **'summary'** - Review all your current responses  
+• **'change [field name]'** - Modify a specific field
+• **'skip'** - Skip optional fields
+• **'review'** - Detailed review of responses
+
+**📊 Progress Tracking:**
+• I'll show progress bars and completion status
+• Required fields are marked with 🔴
+• Optional fields are marked with ⚪
+
+**❓ Questions?** Just ask! I'm here to help make form filling easy."""
+
+_CHANGE_OPTIONS_MESSAGE = """🔧 **Let's make some changes!** You can:
+
+• **Change a specific field:** "Change my name to John"
+• **Review a field:** "What did I put for email?"
+• **Start over:** "Start from the beginning"
+• **Continue with questions:** "Continue with next question"
+
+What would you like to modify?"""
+
+_CONFIRM_UNCLEAR_MESSAGE = """🤔 I didn't quite understand your response. Here are your options:
+
+• **Submit the form:** Reply 'yes' or 'submit'
+• **Make changes:** Reply 'no' or 'change'  
+• **Review responses:** Reply 'review' or 'show summary'
+• **Get help:** Reply 'help' for more options
+
+What would you like to do?"""
+
+_FORM_PICK_REJECTED_MESSAGE = """❌ **No problem!** Let me try to find the right form for you.
+
+🔍 **Help me understand better:**
+• What type of form are you looking for?
+• What's the purpose of the form?
+• Which workspace or context should it be from?
+• Any specific keywords or form names?
+
+The more details you provide, the better I can help you find the correct form."""
+
+_FORM_PICK_UNCLEAR_MESSAGE = """🤔 I need a clear answer to proceed:
+
+• Reply **'yes'** if this is the correct form
+• Reply **'no'** if you need a different form
+• Or provide more details about what form you're looking for
+
+Which form would you like to fill out?"""
+
+
+# Answers this short are taken as a reply to the current question only
+_DIRECT_ANSWER_MAX_WORDS = 2
+_NUMERIC_ANSWER_RE = re.compile(r"[\d\s.,:/+()\-]+")
+
+
+def _is_direct_answer(user_message: str) -> bool:
+    """True for one- or two-word or purely numeric replies, which never fill several fields."""
+    return (
+        len(user_message.split(None, _DIRECT_ANSWER_MAX_WORDS)) <= _DIRECT_ANSWER_MAX_WORDS
+        or _NUMERIC_ANSWER_RE.fullmatch(user_message.strip()) is not None
+    )
+
+
+def _format_br_timestamp(dt: datetime) -> str:
+    """dd/mm/YYYY às HH:MM, composed directly instead of going through strftime."""
+    return f"{dt.day:02d}/{dt.month:02d}/{dt.year} às {dt.hour:02d}:{dt.minute:02d}"
+
+
+def _is_valid_email(value: str) -> bool:
+    """
+    Single-pass check equivalent to ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$,
+    without the backtracking that pattern is prone to on long inputs.
+    """
+    local, at, domain = value.partition("@")
+    if not at or not local or not _EMAIL_LOCAL_CHARS.issuperset(local):
+        return False
+    host, dot, tld = domain.rpartition(".")
+    return (
+        bool(dot) and bool(host) and len(tld) >= 2
+        and _EMAIL_DOMAIN_CHARS.issuperset(host)
+        and _ASCII_LETTERS.issuperset(tld)
+    )
+
+
+def _render_field_prompt(field: Dict) -> str:
+    """Build the question text shown to the user for a field."""
+    field_type = field.get("field_type", "text")
+    question = field.get("question") or field.get("label") or f"Por favor, forneça {field.get('field_id', 'informação')}"
+    description = field.get("description", "")
+    required = field.get("required", False)
+    options = field.get("options", [])
+    examples = field.get("examples", [])
+
+    prompt_parts = [f"{question}"]
+
+    if description:
+        prompt_parts.append(f"{description}")
+
+    # Add field-specific guidance
+    if field_type in ["select", "multiselect"]:
+        if options:
+            prompt_parts.append(f"Opções: {', '.join(options)}")
+    elif field_type == "boolean":
+        prompt_parts.append("Por favor, responda com sim/não ou verdadeiro/falso")
+    elif field_type == "date":
+        prompt_parts.append("Por favor, forneça uma data no formato AAAA-MM-DD (ex: 2024-03-15)")
+    elif field_type == "email":
+        prompt_parts.append("Por favor, forneça um endereço de email válido")
+    elif field_type == "phone":
+        prompt_parts.append("Por favor, forneça um número de telefone (qualquer formato)")
+    elif field_type == "number":
+        prompt_parts.append("Por favor, forneça um número")
+
+    # Add examples if available
+    if examples:
+        prompt_parts.append(f"Exemplos: {', '.join(examples)}")
+
+    # Add requirement indicator
+    if required:
+        prompt_parts.append("Campo obrigatório")
+    else:
+        prompt_parts.append("Campo opcional (você pode pular dizendo 'pular' ou 'nenhum')")
+
+    return "\n".join(prompt_parts)
+
+
+def _lowered_options(options: List[str]) -> List[Tuple[str, str]]:
+    return [(opt, opt.lower()) for opt in options]
+
+
+class _FieldIndex:
+    """Per-template lookups derived once from form_template['fields']."""
+
+    __slots__ = ("template", "by_id", "ordered", "required", "dependents", "extraction_descs",
+                 "options_lower", "prompts", "total", "required_count", "required_ids")
+
+    def __init__(self, template: Dict):
+        self.template = template
+        fields = template.get("fields", [])
+        # (field_id, field) in template order, skipping fields without an id
+        self.ordered = [(f.get("field_id"), f) for f in fields if f.get("field_id")]
+        # First definition wins for duplicated ids, matching the old next(...) scans
+        self.by_id = {}
+        for fid, f in self.ordered:
+            self.by_id.setdefault(fid, f)
+        self.required = [(fid, f) for fid, f in self.ordered if f.get("required", False)]
+        self.required_ids = frozenset(fid for fid, _ in self.required)
+        # Counts over every field definition, as shown to the user
+        self.total = len(fields)
+        self.required_count = sum(1 for f in fields if f.get("required", False))
+        self.dependents = [(fid, f, f["depends_on"]) for fid, f in self.ordered if f.get("depends_on")]
+        # Prompt line per field for multi-field extraction
+        self.extraction_descs = {fid: self._extraction_desc(fid, f) for fid, f in self.ordered}
+        # (option, option.lower()) pairs for select/multiselect matching
+        self.options_lower = {
+            fid: _lowered_options(f.get("options", []))
+            for fid, f in self.ordered
+            if f.get("field_type") in ("select", "multiselect")
+        }
+        # Question text per field; it only depends on the field definition
+        self.prompts = {fid: _render_field_prompt(f) for fid, f in self.ordered}
+
+    def first_unanswered(self, responses: Dict) -> Optional[Tuple[str, Dict]]:
+        """(field_id, field) of the first field, in template order, without a response."""
+        return next(((fid, f) for fid, f in self.ordered if fid not in responses), None)
+
+    @staticmethod
+    def _extraction_desc(field_id: str, field: Dict) -> str:
+        desc = f"- {field_id}: {field.get('label', field_id)}"
+        if field.get('question'):
+            desc += f" ({field['question']})"
+        if field.get('field_type', 'text') in ('select', 'multiselect') and field.get('options'):
+            desc += f" [opções: {', '.join(field['options'])}]"
+        return desc
+
+
+_FIELD_INDEX_CACHE_MAX_SIZE = 256
+# id(template) -> _FieldIndex; the index keeps the template alive, so ids are not reused
+_FIELD_INDEX_CACHE: Dict[int, _FieldIndex] = {}
+
+
+def _field_index_for(template: Dict) -> _FieldIndex:
+    """Return the field index for a template document, building it on first use."""
+    index = _FIELD_INDEX_CACHE.get(id(template))
+    if index is None or index.template is not template:
+        if len(_FIELD_INDEX_CACHE) >= _FIELD_INDEX_CACHE_MAX_SIZE:
+            _FIELD_INDEX_CACHE.pop(next(iter(_FIELD_INDEX_CACHE)))
+        index = _FIELD_INDEX_CACHE[id(template)] = _FieldIndex(template)
+    return index
+
+
+_AI_VALIDATION_CACHE_TTL = 600  # seconds
+_AI_VALIDATION_CACHE_MAX_SIZE = 512
+# (field label, field description, raw answer) -> (cached_at, _ai_validate_response result)
+_AI_VALIDATION_CACHE: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+
+_SIMILAR_SUBMISSIONS_CACHE_TTL = 300  # seconds
+_SIMILAR_SUBMISSIONS_CACHE_MAX_SIZE = 1024
+# (form template id, user id) -> (cached_at, submissions)
+_SIMILAR_SUBMISSIONS_CACHE: Dict[Tuple[str, str], Tuple[float, List[dict]]] = {}
+
+# Shared pool for _call_external_endpoint; closed on app shutdown via close_http_client()
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128),
+        )
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared external-endpoint HTTP client, if it was opened."""
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
+
+_FIELD_CHANGE_CACHE_TTL = 600  # seconds
+_FIELD_CHANGE_CACHE_MAX_SIZE = 2048
+# (template id, normalized request, answered field ids) -> (cached_at, field_id)
+_FIELD_CHANGE_CACHE: Dict[Tuple[str, str, frozenset], Tuple[float, str]] = {}
+
+
+def _field_change_cache_key(template_id: str, user_message: str, answered) -> Tuple[str, str, frozenset]:
+    return (str(template_id), " ".join(user_message.lower().split()), frozenset(answered))
+
+
+def _get_cached_field_change(key: Tuple[str, str, frozenset]) -> Optional[str]:
+    cached = _FIELD_CHANGE_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < _FIELD_CHANGE_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _cache_field_change(key: Tuple[str, str, frozenset], field_id: str) -> None:
+    if len(_FIELD_CHANGE_CACHE) >= _FIELD_CHANGE_CACHE_MAX_SIZE:
+        _FIELD_CHANGE_CACHE.pop(next(iter(_FIELD_CHANGE_CACHE)))
+    _FIELD_CHANGE_CACHE[key] = (time.monotonic(), field_id)
+
+
 class EnhancedFormFillerAgent(EnhancedBaseAgent):
     def __init__(self, db, session_data: SessionData):
         super().__init__(db, session_data)
@@ -28,23 +359,32 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
             logger.info(f"Loading form template with ID: {template_id}")
             
             try:
-                # Ensure we have a valid ObjectId
-                if not ObjectId.is_valid(template_id):
+                # Ensure we have a valid ObjectId; parsed once and reused for the query
+                try:
+                    template_oid = ObjectId(template_id)
+                except (InvalidId, TypeError):
                     raise ValueError(f"Invalid template ID format: {template_id}")
                 
-                self.form_template = await self.db.form_templates.find_one({"_id": ObjectId(template_id)})
+                self.form_template = peek_cached_document("form_templates", template_id)
+                context_loaded = False
+                if self.form_template is None:
+                    # Cold cache: template and its context in one round trip
+                    self.form_template, self.context_info = await self._fetch_template_with_context(template_id, template_oid)
+                    context_loaded = True
                 
                 if not self.form_template:
                     raise ValueError(f"Form template with ID {template_id} not found.")
                 
                 logger.info(f"Loaded form template: {self.form_template.get('title', 'Unknown')}")
-                logger.info(f"Form has {len(self.form_template.get('fields', []))} fields")
+                # Build the field index (lookups, extraction lines, question prompts) up front
+                logger.info(f"Form has {_field_index_for(self.form_template).total} fields")
                 
                 # Also load context information with error handling
                 context_id = self.form_template.get('context_id')
-                if context_id and ObjectId.is_valid(context_id):
+                # get_cached_document parses the id; an invalid one lands in the except below
+                if not context_loaded and context_id:
                     try:
-                        self.context_info = await self.db.contexts.find_one({"_id": ObjectId(context_id)})
+                        self.context_info = await get_cached_document(self.db, "contexts", context_id)
                         logger.info(f"Loaded context: {self.context_info.get('title', 'Unknown') if self.context_info else 'None'}")
                     except Exception as context_error:
                         logger.warning(f"Could not load context {context_id}: {context_error}")
@@ -54,6 +394,32 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
                 logger.error(f"Error loading form template: {e}")
                 raise
 
+    async def _fetch_template_with_context(self, template_id: str, template_oid: ObjectId):
+        """Fetch a template and its context with a single $lookup aggregation, priming the document cache."""
+        docs = await self.db.form_templates.aggregate([
+            {"$match": {"_id": template_oid}},
+            {"$limit": 1},
+            # context_id is stored as a string; convert so it can match contexts._id
+            {"$lookup": {
+                "from": "contexts",
+                "let": {"cid": {"$convert": {"input": "$context_id", "to": "objectId",
+                                             "onError": None, "onNull": None}}},
+                "pipeline": [{"$match": {"$expr": {"$eq": ["$_id", "$$cid"]}}}],
+                "as": "_ctx",
+            }},
+        ]).to_list(1)
+        if not docs:
+            return None, None
+
+        template = docs[0]
+        contexts = template.pop("_ctx", [])
+        context = contexts[0] if contexts else None
+        store_cached_document("form_templates", template_id, template)
+        if context is not None:
+            store_cached_document("contexts", context["_id"], context)
+        logger.info(f"Loaded context: {context.get('title', 'Unknown') if context else 'None'}")
+        return template, context
+
     def _get_confidence_display(self, confidence_score: float) -> str:
         """Generate a user-friendly confidence indicator."""
         if confidence_score >= 0.9:
@@ -69,9 +435,10 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
         """Enhanced field validation with AI assistance for complex fields."""
         field_type = field.get("field_type", "text")
         field_id = field.get("field_id")
+        stripped = user_response.strip()
         validation_result = {
             "is_valid": True,
-            "processed_value": user_response.strip(),
+            "processed_value": stripped,
             "suggestions": [],
             "warning": None
         }
@@ -79,14 +446,13 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
         try:
             # Basic validation by field type
             if field_type == "email":
-                email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                if not re.match(email_pattern, user_response.strip()):
+                if not _is_valid_email(stripped):
                     validation_result["is_valid"] = False
                     validation_result["suggestions"] = ["Please provide a valid email address (e.g., user@example.com)"]
 
             elif field_type == "phone":
                 # Remove common separators and check if it's a reasonable phone number
-                clean_phone = re.sub(r'[\s\-\(\)\+]', '', user_response)
+                clean_phone = _PHONE_STRIP_RE.sub('', user_response)
                 if not clean_phone.isdigit() or len(clean_phone) < 7:
                     validation_result["is_valid"] = False
                     validation_result["suggestions"] = ["Please provide a valid phone number (e.g., +1-555-123-4567)"]
@@ -95,22 +461,29 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
 
             elif field_type == "number":
                 try:
-                    float(user_response.strip())
-                    validation_result["processed_value"] = user_response.strip()
+                    float(stripped)
                 except ValueError:
                     validation_result["is_valid"] = False
                     validation_result["suggestions"] = ["Please provide a valid number"]
 
             elif field_type == "date":
                 # Try to parse various date formats
-                date_formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d %H:%M:%S"]
+                date_text = stripped
                 parsed_date = None
-                for fmt in date_formats:
+                # Fast path for the canonical YYYY-MM-DD answer, skipping strptime
+                if (len(date_text) == 10 and date_text[4] == '-' and date_text[7] == '-'
+                        and date_text[:4].isdigit() and date_text[5:7].isdigit() and date_text[8:].isdigit()):
                     try:
-                        parsed_date = datetime.strptime(user_response.strip(), fmt)
-                        break
+                        parsed_date = datetime(int(date_text[:4]), int(date_text[5:7]), int(date_text[8:]))
                     except ValueError:
-                        continue
+                        pass
+                if not parsed_date:
+                    for fmt in _DATE_FORMATS:
+                        try:
+                            parsed_date = datetime.strptime(date_text, fmt)
+                            break
+                        except ValueError:
+                            continue
                 
                 if not parsed_date:
                     validation_result["is_valid"] = False
@@ -121,14 +494,18 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
             elif field_type in ["select", "multiselect"]:
                 options = field.get("options", [])
                 if options:
-                    user_response_lower = user_response.lower().strip()
+                    user_response_lower = stripped.lower()
+                    lowered = self._lowered_options_for(field)
                     # Check for exact matches first
-                    exact_matches = [opt for opt in options if opt.lower() == user_response_lower]
+                    exact_matches = [opt for opt, opt_lower in lowered if opt_lower == user_response_lower]
                     if exact_matches:
                         validation_result["processed_value"] = exact_matches[0]
                     else:
                         # Check for partial matches
-                        partial_matches = [opt for opt in options if user_response_lower in opt.lower() or opt.lower() in user_response_lower]
+                        partial_matches = [
+                            opt for opt, opt_lower in lowered
+                            if user_response_lower in opt_lower or opt_lower in user_response_lower
+                        ]
                         if partial_matches:
                             if len(partial_matches) == 1:
                                 validation_result["processed_value"] = partial_matches[0]
@@ -141,15 +518,10 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
                             validation_result["suggestions"] = [f"Please choose from: {', '.join(options)}"]
 
             elif field_type == "boolean":
-                positive_responses = ["yes", "y", "true", "1", "ok", "correct", "right",
-                                    "sim", "s", "verdadeiro", "certo", "correto"]
-                negative_responses = ["no", "n", "false", "0", "wrong", "incorrect",
-                                    "não", "nao", "falso", "errado", "incorreto"]
-
-                user_response_lower = user_response.lower().strip()
-                if user_response_lower in positive_responses:
+                user_response_lower = stripped.lower()
+                if user_response_lower in _BOOL_TRUE:
                     validation_result["processed_value"] = "true"
-                elif user_response_lower in negative_responses:
+                elif user_response_lower in _BOOL_FALSE:
                     validation_result["processed_value"] = "false"
                 else:
                     validation_result["is_valid"] = False
@@ -171,6 +543,12 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
         """Use AI to validate complex field responses."""
         field_description = field.get("description", "")
         field_label = field.get("label", field.get("field_id", ""))
+
+        # The verdict depends only on what goes into the prompt
+        cache_key = (field_label, field_description, user_response)
+        cached = _AI_VALIDATION_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _AI_VALIDATION_CACHE_TTL:
+            return dict(cached[1])
         
         prompt = f"""You are helping validate a user's response to a form field.
 
@@ -194,13 +572,17 @@ Respond with JSON in this format:
 
         try:
             response = await self.llm.ainvoke(prompt)
-            result = json.loads(response.content)
-            return {
+            result = orjson.loads(response.content)
+            validation = {
                 "is_valid": result.get("is_valid", False),
                 "processed_value": result.get("processed_value", user_response),
                 "suggestions": result.get("suggestions", []),
                 "ai_explanation": result.get("explanation", "")
             }
+            if len(_AI_VALIDATION_CACHE) >= _AI_VALIDATION_CACHE_MAX_SIZE:
+                _AI_VALIDATION_CACHE.pop(next(iter(_AI_VALIDATION_CACHE)))
+            _AI_VALIDATION_CACHE[cache_key] = (time.monotonic(), validation)
+            return dict(validation)
         except Exception as e:
             logger.error(f"AI validation failed: {e}")
             return {"is_valid": False, "suggestions": ["Could not validate automatically"]}
@@ -211,79 +593,50 @@ Respond with JSON in this format:
             logger.warning("Form template not loaded")
             return None
 
-        form_fields = self.form_template.get("fields", [])
-        logger.info(f"Checking {len(form_fields)} fields for next question")
-        logger.info(f"Current responses: {list(self.session_data.responses.keys())}")
-        
+        index = _field_index_for(self.form_template)
+        responses = self.session_data.responses
+        logger.info(f"Checking {len(index.ordered)} fields for next question")
+        logger.info(f"Current responses: {len(responses)} answered")
+
         # Priority 1: Required fields that haven't been answered
-        for field in form_fields:
-            field_id = field.get("field_id")
-            is_required = field.get("required", False)
-            
-            if is_required and field_id and field_id not in self.session_data.responses:
+        for field_id, field in index.required:
+            if field_id not in responses:
                 logger.info(f"Found next required question: {field_id}")
                 return field
-        
+
         # Priority 2: Fields with dependencies that are now available
-        for field in form_fields:
-            field_id = field.get("field_id")
-            depends_on = field.get("depends_on")
-            
-            if (field_id and field_id not in self.session_data.responses and
-                depends_on and depends_on in self.session_data.responses):
+        for field_id, field, depends_on in index.dependents:
+            if field_id not in responses and depends_on in responses:
                 logger.info(f"Found next dependent question: {field_id}")
                 return field
-        
+
         # Priority 3: Any unanswered field
-        for field in form_fields:
-            field_id = field.get("field_id")
-            if field_id and field_id not in self.session_data.responses:
-                logger.info(f"Found next optional question: {field_id}")
-                return field
+        unanswered = index.first_unanswered(responses)
+        if unanswered:
+            logger.info(f"Found next optional question: {unanswered[0]}")
+            return unanswered[1]
                 
         logger.info("No more questions to ask")
         return None
 
+    def _lowered_options_for(self, field: Dict) -> List[Tuple[str, str]]:
+        """(option, option.lower()) pairs, from the template index when the field belongs to it."""
+        if self.form_template:
+            index = _field_index_for(self.form_template)
+            field_id = field.get("field_id")
+            if index.by_id.get(field_id) is field and field_id in index.options_lower:
+                return index.options_lower[field_id]
+        return _lowered_options(field.get("options", []))
+
     async def _get_field_prompt(self, field: Dict) -> str:
         """Generate an enhanced, interactive prompt for a field."""
-        field_type = field.get("field_type", "text")
-        question = field.get("question") or field.get("label") or f"Por favor, forneça {field.get('field_id', 'informação')}"
-        description = field.get("description", "")
-        required = field.get("required", False)
-        options = field.get("options", [])
-        examples = field.get("examples", [])
-
-        prompt_parts = [f"{question}"]
-
-        if description:
-            prompt_parts.append(f"{description}")
-
-        # Add field-specific guidance
-        if field_type in ["select", "multiselect"]:
-            if options:
-                prompt_parts.append(f"Opções: {', '.join(options)}")
-        elif field_type == "boolean":
-            prompt_parts.append("Por favor, responda com sim/não ou verdadeiro/falso")
-        elif field_type == "date":
-            prompt_parts.append("Por favor, forneça uma data no formato AAAA-MM-DD (ex: 2024-03-15)")
-        elif field_type == "email":
-            prompt_parts.append("Por favor, forneça um endereço de email válido")
-        elif field_type == "phone":
-            prompt_parts.append("Por favor, forneça um número de telefone (qualquer formato)")
-        elif field_type == "number":
-            prompt_parts.append("Por favor, forneça um número")
-
-        # Add examples if available
-        if examples:
-            prompt_parts.append(f"Exemplos: {', '.join(examples)}")
-
-        # Add requirement indicator
-        if required:
-            prompt_parts.append("Campo obrigatório")
-        else:
-            prompt_parts.append("Campo opcional (você pode pular dizendo 'pular' ou 'nenhum')")
-
-        return "\n".join(prompt_parts)
+        # Template fields are rendered once per template by _FieldIndex
+        if self.form_template:
+            index = _field_index_for(self.form_template)
+            field_id = field.get("field_id")
+            if index.by_id.get(field_id) is field:
+                return index.prompts[field_id]
+        return _render_field_prompt(field)
 
     async def _extract_multiple_fields_from_message(self, user_message: str) -> Dict[str, Any]:
         """Use AI to extract multiple field values from a single user message."""
@@ -291,31 +644,15 @@ Respond with JSON in this format:
             await self._load_form_template()
 
             # Get all unfilled fields
-            unfilled_fields = []
-            for field in self.form_template.get('fields', []):
-                field_id = field.get('field_id')
-                if field_id and field_id not in self.session_data.responses:
-                    unfilled_fields.append({
-                        'field_id': field_id,
-                        'label': field.get('label', field_id),
-                        'question': field.get('question', ''),
-                        'field_type': field.get('field_type', 'text'),
-                        'options': field.get('options', []),
-                        'required': field.get('required', False)
-                    })
-
-            if not unfilled_fields:
+            index = _field_index_for(self.form_template)
+            responses = self.session_data.responses
+            unfilled_ids = [field_id for field_id, _ in index.ordered if field_id not in responses]
+
+            if not unfilled_ids:
                 return {}
 
-            # Create extraction prompt
-            fields_info = []
-            for field in unfilled_fields:
-                field_desc = f"- {field['field_id']}: {field['label']}"
-                if field['question']:
-                    field_desc += f" ({field['question']})"
-                if field['field_type'] in ['select', 'multiselect'] and field['options']:
-                    field_desc += f" [opções: {', '.join(field['options'])}]"
-                fields_info.append(field_desc)
+            # Create extraction prompt from the per-field descriptions built at index time
+            fields_info = [index.extraction_descs[field_id] for field_id in unfilled_ids]
 
             extraction_prompt = f"""Você é um especialista em extrair informações de mensagens de usuários para preencher formulários.
 
@@ -347,27 +684,21 @@ Regras importantes:
             try:
                 # Clean the response - remove markdown formatting if present
                 if extracted_text.startswith('```'):
-                    lines = extracted_text.split('\n')
-                    json_lines = []
-                    in_json = False
-                    for line in lines:
-                        if line.strip().startswith('```'):
-                            in_json = not in_json
-                            continue
-                        if in_json:
-                            json_lines.append(line)
-                    extracted_text = '\n'.join(json_lines)
+                    # Drop the opening fence line (```json) and everything from the closing fence on
+                    _, _, rest = extracted_text.partition('\n')
+                    body, fence, _ = rest.rpartition('```')
+                    extracted_text = body if fence else rest
 
-                extracted_data = json.loads(extracted_text)
+                extracted_data = orjson.loads(extracted_text)
 
                 # Validate extracted fields exist in our form
-                valid_field_ids = {f['field_id'] for f in unfilled_fields}
+                valid_field_ids = set(unfilled_ids)
                 filtered_data = {k: v for k, v in extracted_data.items() if k in valid_field_ids and v}
 
                 logger.info(f"Extracted {len(filtered_data)} fields from message: {filtered_data}")
                 return filtered_data
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"Failed to parse extraction response as JSON: {e}")
                 return {}
 
@@ -409,45 +740,22 @@ Regras importantes:
 
         return confirmation_message
 
-    async def _finalize_form(self):
-        """Enhanced form finalization with better data processing."""
-        logger.info("Finalizing form submission")
-
-        # Update session state and save to Redis FIRST
-        self.session_data.state = "COMPLETED"
-        self.session_data.updated_at = datetime.utcnow()
-
-        # Save session state to Redis immediately to prevent confirmation loops
-        try:
-            from app.sessions.session_manager import RedisManager
-            redis_manager = RedisManager()
-            redis_client = await redis_manager.get_redis()
-
-            session_dict = self.session_data.to_dict()
-            await redis_client.setex(
-                f"session:{self.session_data.session_id}",
-                120 * 60,  # TTL in seconds (2 hours)
-                json.dumps(session_dict, default=str)
-            )
-            logger.info(f"Session state updated to COMPLETED in Redis for session {self.session_data.session_id}")
-        except Exception as e:
-            logger.error(f"Failed to save session state to Redis: {e}")
-            # Continue anyway - we don't want Redis failures to block form submission
-
+    def _build_form_response(self) -> Dict[str, Any]:
+        """Completion stats and type-processed answers as the form_responses document."""
         # Calculate completion stats
-        form_fields = self.form_template.get('fields', [])
-        total_fields = len(form_fields)
+        index = _field_index_for(self.form_template)
+        total_fields = index.total
         completed_fields = len(self.session_data.responses)
-        required_fields = [f for f in form_fields if f.get('required', False)]
-        completed_required = len([f for f in required_fields if f.get('field_id') in self.session_data.responses])
+        required_count = index.required_count
+        completed_required = len(index.required_ids & self.session_data.responses.keys())
 
         completion_percentage = (completed_fields / total_fields) * 100 if total_fields > 0 else 100
-        required_completion = (completed_required / len(required_fields)) * 100 if required_fields else 100
+        required_completion = (completed_required / required_count) * 100 if required_count else 100
 
         # Process and clean responses
         processed_responses = {}
         for field_id, response in self.session_data.responses.items():
-            field = next((f for f in form_fields if f.get('field_id') == field_id), None)
+            field = index.by_id.get(field_id)
             if field:
                 # Apply any final processing based on field type
                 field_type = field.get('field_type', 'text')
@@ -463,7 +771,7 @@ Regras importantes:
             else:
                 processed_responses[field_id] = response
 
-        form_response = {
+        return {
             "form_template_id": ObjectId(self.session_data.form_template_id),
             "context_id": ObjectId(self.form_template.get('context_id')) if self.form_template.get('context_id') else None,
             "respondent_id": ObjectId(self.session_data.user_id),
@@ -478,31 +786,65 @@ Regras importantes:
             "metadata": {
                 "total_fields": total_fields,
                 "completed_fields": completed_fields,
-                "required_fields": len(required_fields),
+                "required_fields": required_count,
                 "completed_required_fields": completed_required,
                 "conversation_turns": len(self.session_data.conversation_history)
             }
         }
 
-        # Try to save to MongoDB Atlas - but don't let failures block the completion
-        try:
-            result = await self.db.form_responses.insert_one(form_response)
-            logger.info(f"Form response saved to MongoDB with ID: {result.inserted_id}")
+    async def _finalize_form(self):
+        """Enhanced form finalization with better data processing."""
+        logger.info("Finalizing form submission")
 
-            # Update session with submission ID
-            self.session_data.submission_id = str(result.inserted_id)
+        # Mark the session completed; it is written to Redis once the Mongo insert settles
+        self.session_data.state = "COMPLETED"
+        self.session_data.updated_at = datetime.utcnow()
+        from app.sessions.session_manager import RedisManager, SESSION_TTL_SECONDS
+        # Built once; submission_id is patched in before the write that carries it
+        session_dict = self.session_data.to_dict()
 
-            # Try to update Redis with submission ID
+        async def save_completed_state():
+            # Persist COMPLETED to prevent confirmation loops
             try:
-                session_dict = self.session_data.to_dict()
+                redis_client = await RedisManager().get_redis()
                 await redis_client.setex(
                     f"session:{self.session_data.session_id}",
-                    120 * 60,  # TTL in seconds (2 hours)
-                    json.dumps(session_dict, default=str)
+                    SESSION_TTL_SECONDS,
+                    self.session_data.to_json(session_dict)
                 )
-                logger.info(f"Updated session with submission ID in Redis")
-            except Exception as redis_e:
-                logger.warning(f"Failed to update Redis with submission ID: {redis_e}")
+                logger.info(f"Session state updated to COMPLETED in Redis for session {self.session_data.session_id}")
+            except Exception as e:
+                logger.error(f"Failed to save session state to Redis: {e}")
+                # Continue anyway - we don't want Redis failures to block form submission
+
+        # Insert first so that, on the usual fast path, one Redis write carries both
+        # COMPLETED and the submission ID. If Mongo is slow, COMPLETED is written
+        # while the insert is still running - Mongo failures must not block the completion.
+        # A response that cannot even be built (bad ids or answers) takes the same
+        # fallback path as a failed insert, so the user is never stuck in confirmation
+        completed_state_saved = False
+        try:
+            insert = asyncio.ensure_future(self.db.form_responses.insert_one(self._build_form_response()))
+            result = await asyncio.wait_for(asyncio.shield(insert), timeout=FAST_INSERT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Form response insert is slow; saving COMPLETED state before it finishes")
+            await save_completed_state()
+            completed_state_saved = True
+            try:
+                result = await insert
+            except Exception as e:
+                result = e
+        except Exception as e:
+            result = e
+
+        try:
+            if isinstance(result, BaseException):
+                raise result
+            logger.info(f"Form response saved to MongoDB with ID: {result.inserted_id}")
+
+            # Update session with submission ID and persist it with the COMPLETED state
+            self.session_data.submission_id = session_dict['submission_id'] = str(result.inserted_id)
+            await save_completed_state()
 
             # Clear form session data to prevent routing back to form_filler
             logger.info("Clearing form session data after successful submission")
@@ -516,11 +858,12 @@ Regras importantes:
             logger.error(f"Error saving form response to MongoDB: {e}")
 
             # Even if MongoDB fails, we still consider the form "completed"
-            # because the user confirmed it and we saved the state to Redis
+            # because the user confirmed it and we save the state to Redis
+            if not completed_state_saved:
+                await save_completed_state()
             logger.info("Form marked as completed despite MongoDB error - user won't be stuck in confirmation loop")
 
             # Generate a fallback submission ID based on timestamp and session
-            import time
             fallback_id = f"fallback_{int(time.time())}_{self.session_data.session_id[:8]}"
             self.session_data.submission_id = fallback_id
 
@@ -533,20 +876,14 @@ Regras importantes:
 
     async def _handle_confirmation_state(self, user_message: str):
         """Enhanced confirmation handling with more interactive options."""
-        logger.info(f"🔍 CONFIRMATION HANDLER CALLED: session={self.session_data.session_id}, message='{user_message}', state={self.session_data.state}")
+        logger.info("🔍 CONFIRMATION HANDLER CALLED: session=%s, message='%s', state=%s",
+                    self.session_data.session_id, user_message, self.session_data.state)
 
         user_msg_lower = user_message.lower().strip()
 
-        # Positive confirmations (English and Portuguese)
-        positive_indicators = ["yes", "y", "submit", "correct", "ok", "confirm", "sure", "right", "good", "looks good", "perfect",
-                             "sim", "s", "enviar", "submeter", "correto", "certo", "confirmar", "confirma", "perfeito", "bom"]
-        negative_indicators = ["no", "n", "wrong", "incorrect", "change", "edit", "fix", "not right", "modify",
-                             "não", "nao", "errado", "incorreto", "mudar", "alterar", "editar", "modificar"]
-        review_indicators = ["review", "show", "check", "look", "see", "summary", "revisar", "mostrar", "verificar", "ver", "resumo"]
-        
-        logger.info(f"🔍 CHECKING CONFIRMATION: user_msg_lower='{user_msg_lower}', positive_indicators={positive_indicators[:5]}...")
+        logger.debug("🔍 CHECKING CONFIRMATION: user_msg_lower='%s'", user_msg_lower)
 
-        if any(indicator in user_msg_lower for indicator in positive_indicators):
+        if _CONFIRM_POSITIVE_RE.search(user_msg_lower):
             logger.info(f"✅ POSITIVE CONFIRMATION DETECTED: '{user_message}' - Processing form submission...")
             try:
                 form_response_id = await self._finalize_form()
@@ -556,7 +893,7 @@ Regras importantes:
                 context_title = self.context_info.get('title', 'your workspace') if self.context_info else 'your workspace'
 
                 # Clean completion message
-                total_fields = len(self.form_template.get('fields', []))
+                total_fields = _field_index_for(self.form_template).total
                 completed_fields = len(self.session_data.responses)
 
                 # Check if this was a fallback ID (MongoDB failed)
@@ -573,7 +910,7 @@ Regras importantes:
 📊 **RESUMO:**
 • Campos preenchidos: {completed_fields}/{total_fields}
 • Status: Completo ✅
-• Data/Hora: {datetime.now().strftime('%d/%m/%Y às %H:%M')}
+• Data/Hora: {_format_br_timestamp(datetime.now())}
 
 ⚠️ **Nota:** Seus dados foram processados com sucesso, mas podem haver atrasos na sincronização com o banco de dados principal.
 🔒 Suas respostas foram registradas e o formulário foi completado!"""
@@ -588,7 +925,7 @@ Regras importantes:
 📊 **RESUMO:**
 • Campos preenchidos: {completed_fields}/{total_fields}
 • Status: Completo ✅
-• Data/Hora: {datetime.now().strftime('%d/%m/%Y às %H:%M')}
+• Data/Hora: {_format_br_timestamp(datetime.now())}
 
 🔒 Seus dados foram salvos com segurança. Obrigado por usar o assistente de formulários!"""
 
@@ -605,40 +942,22 @@ Regras importantes:
                     is_complete=False
                 )
         
-        elif any(indicator in user_msg_lower for indicator in review_indicators):
+        elif _CONFIRM_REVIEW_RE.search(user_msg_lower):
             # User wants to review responses again
             summary_message = await self._generate_response_summary(detailed=True)
             summary_message += "\n\n**Ready to submit?** Reply 'yes' to submit or 'no' to make changes."
             return await self._build_success_response(summary_message)
             
-        elif any(indicator in user_msg_lower for indicator in negative_indicators):
+        elif _CONFIRM_NEGATIVE_RE.search(user_msg_lower):
             # User wants to make changes
             self.session_data.state = "IN_PROGRESS"
             
-            change_message = """🔧 **Let's make some changes!** You can:
-
-• **Change a specific field:** "Change my name to John"
-• **Review a field:** "What did I put for email?"
-• **Start over:** "Start from the beginning"
-• **Continue with questions:** "Continue with next question"
-
-What would you like to modify?"""
-            
-            return await self._build_success_response(change_message)
+            return await self._build_success_response(_CHANGE_OPTIONS_MESSAGE)
         
         else:
             # Unclear response, provide helpful options
-            logger.info(f"❓ NO MATCH FOUND for '{user_message}' - providing clarification")
-            clarification_message = """🤔 I didn't quite understand your response. Here are your options:
-
-• **Submit the form:** Reply 'yes' or 'submit'
-• **Make changes:** Reply 'no' or 'change'  
-• **Review responses:** Reply 'review' or 'show summary'
-• **Get help:** Reply 'help' for more options
-
-What would you like to do?"""
-            
-            return await self._build_success_response(clarification_message)
+            logger.info("❓ NO MATCH FOUND for '%s' - providing clarification", user_message)
+            return await self._build_success_response(_CONFIRM_UNCLEAR_MESSAGE)
 
     async def _generate_response_summary(self, detailed: bool = False) -> str:
         """Generate a clean, report-style summary of current responses."""
@@ -646,39 +965,32 @@ What would you like to do?"""
             return "📝 Nenhuma resposta registrada ainda."
 
         form_fields = self.form_template.get('fields', [])
+        responses = self.session_data.responses
 
-        # Separate completed and missing fields
-        completed_fields = []
+        # Separate completed and missing fields; completed lines are rendered directly
+        completed_lines = []
         missing_required = []
-        missing_optional = []
+        missing_optional = 0
 
         for field in form_fields:
             field_id = field.get('field_id')
-            field_label = field.get('label', field_id)
             is_required = field.get('required', False)
 
-            if field_id in self.session_data.responses:
-                response = self.session_data.responses[field_id]
-                completed_fields.append({
-                    'label': field_label,
-                    'value': response,
-                    'required': is_required
-                })
+            if field_id in responses:
+                icon = "🔴" if is_required else "⚪"
+                completed_lines.append(f"{icon} **{field.get('label', field_id)}:** {responses[field_id]}")
+            elif is_required:
+                missing_required.append(field.get('label', field_id))
             else:
-                if is_required:
-                    missing_required.append(field_label)
-                else:
-                    missing_optional.append(field_label)
+                missing_optional += 1
 
         # Build clean report format
         summary_parts = ["📋 **RELATÓRIO DE RESPOSTAS**"]
 
         # Completed fields section
-        if completed_fields:
+        if completed_lines:
             summary_parts.append("\n✅ **CAMPOS PREENCHIDOS:**")
-            for field in completed_fields:
-                icon = "🔴" if field['required'] else "⚪"
-                summary_parts.append(f"{icon} **{field['label']}:** {field['value']}")
+            summary_parts.extend(completed_lines)
 
         # Missing required fields (if any)
         if missing_required:
@@ -688,13 +1000,14 @@ What would you like to do?"""
 
         # Missing optional fields (if any, but only show count)
         if missing_optional:
-            summary_parts.append(f"\n⚪ **CAMPOS OPCIONAIS FALTANDO:** {len(missing_optional)}")
+            summary_parts.append(f"\n⚪ **CAMPOS OPCIONAIS FALTANDO:** {missing_optional}")
 
         # Progress summary
-        total_fields = len(form_fields)
-        completed_count = len(completed_fields)
-        required_count = len([f for f in form_fields if f.get('required', False)])
-        completed_required_count = len([f for f in completed_fields if f['required']])
+        index = _field_index_for(self.form_template)
+        total_fields = index.total
+        completed_count = len(completed_lines)
+        required_count = index.required_count
+        completed_required_count = len(index.required_ids & self.session_data.responses.keys())
 
         summary_parts.append(f"\n📊 **PROGRESSO:** {completed_count}/{total_fields} campos completos")
         summary_parts.append(f"📋 **OBRIGATÓRIOS:** {completed_required_count}/{required_count} ✅")
@@ -722,12 +1035,20 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
 """
         
         try:
-            response = await self.llm.ainvoke(prompt)
-            field_id = response.content.strip()
+            # Identical requests against the same answered fields resolve to the same field
+            cache_key = _field_change_cache_key(
+                self.session_data.form_template_id, user_message, self.session_data.responses
+            )
+            field_id = _get_cached_field_change(cache_key)
+            if field_id is None:
+                response = await self.llm.ainvoke(prompt)
+                field_id = response.content.strip()
+                if field_id != "UNCLEAR" and field_id in self.session_data.responses:
+                    _cache_field_change(cache_key, field_id)
             
             if field_id != "UNCLEAR" and field_id in self.session_data.responses:
                 # Find the field
-                field = next((f for f in self.form_template.get('fields', []) if f.get('field_id') == field_id), None)
+                field = _field_index_for(self.form_template).by_id.get(field_id)
                 if field:
                     # Set this as the current field to be changed
                     self.session_data.current_field = field_id
@@ -757,6 +1078,65 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
                 await self._generate_response_summary()
             )
 
+    def _build_welcome_message(self) -> str:
+        """Build the welcome text shown when a form conversation starts."""
+        form_title = self.form_template.get('title', 'the form')
+        form_description = self.form_template.get('description', '')
+        context_title = self.context_info.get('title', 'your workspace') if self.context_info else 'your workspace'
+
+        welcome_parts = [f"Olá! Estou aqui para ajudá-lo a preencher '{form_title}' para {context_title}."]
+
+        if form_description:
+            welcome_parts.append(f"Sobre este formulário: {form_description}")
+
+        # Get form statistics
+        index = _field_index_for(self.form_template)
+        total_fields = index.total
+        required_fields = index.required_count
+
+        if required_fields > 0:
+            welcome_parts.append(f"Este formulário tem {total_fields} campos no total, com {required_fields} campos obrigatórios.")
+        else:
+            welcome_parts.append(f"Este formulário tem {total_fields} campos, nenhum é obrigatório.")
+
+        welcome_parts.append("Vou guiá-lo através de cada campo passo a passo. Vamos começar!")
+
+        return "\n\n".join(welcome_parts)
+
+    async def start_and_process(self, user_message: str):
+        """
+        Start the conversation and extract fields from the user's first message in one pass.
+        Loads the template once and builds a single response: the welcome followed by the
+        captured information, or just the next question when nothing useful was extracted.
+        """
+        try:
+            await self._load_form_template()
+        except Exception:
+            # Let start_conversation build the standard loading error response
+            return await self.start_conversation()
+
+        # Low-confidence predictions must be confirmed before anything is extracted
+        if getattr(self.session_data, 'prediction_confidence', 1.0) < 0.7:
+            return await self.start_conversation()
+
+        welcome_message = self._build_welcome_message()
+        self.session_data.conversation_history.append({"role": "bot", "message": welcome_message})
+
+        next_question_field = self._get_next_question()
+        if not next_question_field:
+            self.session_data.state = "CONFIRMATION"
+            no_fields_message = f"{welcome_message}\n\n⚠️ This form appears to have no fields to fill out. Would you like me to submit it as is?"
+            return await self._build_success_response(no_fields_message, is_complete=False)
+
+        self.session_data.state = "IN_PROGRESS"
+        self.session_data.current_field = next_question_field.get("field_id")
+
+        response = await self.process_message(user_message)
+        extraction_msg = response.get("message", "")
+        if extraction_msg and "Informações capturadas" in extraction_msg:
+            response["message"] = f"{welcome_message}\n\n{extraction_msg}"
+        return response
+
     async def start_conversation(self):
         """Enhanced conversation starter with confidence handling."""
         try:
@@ -769,16 +1149,14 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
             # Check if this is a low-confidence prediction
             confidence_score = getattr(self.session_data, 'prediction_confidence', 1.0)
             
-            welcome_parts = []
-            
             if confidence_score < 0.7:
                 # Show confidence information for low-confidence predictions
                 form_details = {
                     "title": form_title,
                     "description": form_description,
                     "context_title": context_title,
-                    "field_count": len(self.form_template.get('fields', [])),
-                    "required_fields": len([f for f in self.form_template.get('fields', []) if f.get('required', False)])
+                    "field_count": _field_index_for(self.form_template).total,
+                    "required_fields": _field_index_for(self.form_template).required_count
                 }
                 
                 confirmation_msg = await self._handle_form_confidence_confirmation(confidence_score, form_details)
@@ -787,23 +1165,7 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
                 return await self._build_success_response(confirmation_msg)
             
             # High confidence - proceed directly
-            welcome_parts.append(f"Olá! Estou aqui para ajudá-lo a preencher '{form_title}' para {context_title}.")
-
-            if form_description:
-                welcome_parts.append(f"Sobre este formulário: {form_description}")
-
-            # Get form statistics
-            total_fields = len(self.form_template.get('fields', []))
-            required_fields = len([f for f in self.form_template.get('fields', []) if f.get('required', False)])
-
-            if required_fields > 0:
-                welcome_parts.append(f"Este formulário tem {total_fields} campos no total, com {required_fields} campos obrigatórios.")
-            else:
-                welcome_parts.append(f"Este formulário tem {total_fields} campos, nenhum é obrigatório.")
-
-            welcome_parts.append("Vou guiá-lo através de cada campo passo a passo. Vamos começar!")
-            
-            welcome_message = "\n\n".join(welcome_parts)
+            welcome_message = self._build_welcome_message()
             
             self.session_data.conversation_history.append({"role": "bot", "message": welcome_message})
 
@@ -834,72 +1196,76 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
             await self._load_form_template()
             self.session_data.conversation_history.append({"role": "user", "message": user_message})
 
-            print(f"🔍 ENHANCED_FORM_AGENT: session={self.session_data.session_id}, state={self.session_data.state}, message='{user_message}'")
-            logger.info(f"🔍 PROCESS_MESSAGE: session={self.session_data.session_id}, state={self.session_data.state}, message='{user_message}'")
+            logger.info("🔍 PROCESS_MESSAGE: session=%s, state=%s, message='%s'",
+                        self.session_data.session_id, self.session_data.state, user_message)
 
             # Handle different states (support both enum and string values)
-            state_value = self.session_data.state.value if hasattr(self.session_data.state, 'value') else str(self.session_data.state)
+            state_value = self.session_data.state.value
 
             if state_value == "AWAITING_FORM_CONFIRMATION":
-                logger.info(f"🔀 Routing to AWAITING_FORM_CONFIRMATION handler")
+                logger.info("🔀 Routing to AWAITING_FORM_CONFIRMATION handler")
                 return await self._handle_form_confirmation(user_message)
 
             if state_value == "CONFIRMATION":
-                print(f"🔀 ROUTING TO CONFIRMATION HANDLER!")
-                logger.info(f"🔀 Routing to CONFIRMATION handler")
+                logger.info("🔀 Routing to CONFIRMATION handler")
                 return await self._handle_confirmation_state(user_message)
 
             # Check for special commands
             user_msg_lower = user_message.lower().strip()
             
-            if user_msg_lower in ["help", "commands", "options"]:
+            if user_msg_lower in _HELP_COMMANDS:
                 return await self._handle_help_request()
             
-            if user_msg_lower in ["skip", "none", "n/a", "not applicable"]:
+            if user_msg_lower in _SKIP_COMMANDS:
                 return await self._handle_skip_request()
             
-            if "change" in user_msg_lower or "modify" in user_msg_lower or "update" in user_msg_lower:
+            if _CHANGE_COMMAND_RE.search(user_msg_lower):
                 return await self._handle_field_change_request(user_message)
             
-            if user_msg_lower in ["summary", "review", "show", "what did i answer"]:
+            if user_msg_lower in _SUMMARY_COMMANDS:
                 summary_message = await self._generate_response_summary(detailed=True)
                 summary_message += "\n\n💬 **Continue:** I'll ask the next question, or tell me if you want to change anything."
                 return await self._build_success_response(summary_message)
 
-            # ENHANCED: Try to extract multiple fields from any message
-            extracted_fields = await self._extract_multiple_fields_from_message(user_message)
-
             # Handle main form filling flow
-            current_field_id = getattr(self.session_data, 'current_field', None)
-            acknowledgment_parts = []
+            current_field_id = self.session_data.current_field
 
-            # Process extracted fields first
-            for field_id, extracted_value in extracted_fields.items():
-                # Find the field definition
-                field_def = next(
-                    (f for f in self.form_template.get('fields', []) if f.get('field_id') == field_id),
-                    None
-                )
+            # ENHANCED: Try to extract multiple fields from any message. Short answers to the
+            # current question cannot carry other fields, so they skip the LLM extraction call
+            if current_field_id and _is_direct_answer(user_message):
+                extracted_fields = {}
+            else:
+                extracted_fields = await self._extract_multiple_fields_from_message(user_message)
+            acknowledgment_parts = []
 
-                if field_def:
-                    # Validate the extracted value
-                    validation_result = await self._validate_field_response(field_def, extracted_value)
+            # Process extracted fields first; validations (which may call the LLM) run concurrently
+            by_id = _field_index_for(self.form_template).by_id
+            to_validate = [
+                (field_id, by_id[field_id], extracted_value)
+                for field_id, extracted_value in extracted_fields.items()
+                if field_id in by_id
+            ]
+            validation_results = await asyncio.gather(
+                *(self._validate_field_response(field_def, value) for _, field_def, value in to_validate),
+                return_exceptions=True,
+            )
 
-                    if validation_result["is_valid"]:
-                        self.session_data.responses[field_id] = validation_result["processed_value"]
-                        field_label = field_def.get('label', field_id)
-                        acknowledgment_parts.append(f"✅ {field_label}: {validation_result['processed_value']}")
-                        logger.info(f"Auto-extracted and saved {field_id}: {validation_result['processed_value']}")
-                    else:
-                        logger.warning(f"Extracted value for {field_id} failed validation: {extracted_value}")
+            # Applied in extraction order so acknowledgments read the same as before
+            for (field_id, field_def, extracted_value), validation_result in zip(to_validate, validation_results):
+                if isinstance(validation_result, Exception):
+                    logger.error(f"Error validating extracted value for {field_id}: {validation_result}")
+                elif validation_result["is_valid"]:
+                    self.session_data.responses[field_id] = validation_result["processed_value"]
+                    field_label = field_def.get('label', field_id)
+                    acknowledgment_parts.append(f"✅ {field_label}: {validation_result['processed_value']}")
+                    logger.info(f"Auto-extracted and saved {field_id}: {validation_result['processed_value']}")
+                else:
+                    logger.warning(f"Extracted value for {field_id} failed validation: {extracted_value}")
 
             # Handle the current field if it wasn't already extracted
             if current_field_id and current_field_id not in extracted_fields:
                 # Find the field definition
-                current_field = next(
-                    (f for f in self.form_template.get('fields', []) if f.get('field_id') == current_field_id),
-                    None
-                )
+                current_field = _field_index_for(self.form_template).by_id.get(current_field_id)
 
                 if current_field:
                     # Validate the response for the current field
@@ -924,10 +1290,7 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
 
             # Handle case where current field validation failed but wasn't extracted
             if current_field_id and current_field_id not in extracted_fields and not acknowledgment_parts:
-                current_field = next(
-                    (f for f in self.form_template.get('fields', []) if f.get('field_id') == current_field_id),
-                    None
-                )
+                current_field = _field_index_for(self.form_template).by_id.get(current_field_id)
 
                 if current_field:
                     # Validate the response for the current field
@@ -962,13 +1325,10 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
                     acknowledgment = "✅ Registrei sua resposta."
                 else:
                     # No current field, try to find any unanswered field
-                    all_fields = self.form_template.get('fields', [])
-                    for field in all_fields:
-                        field_id = field.get('field_id')
-                        if field_id and field_id not in self.session_data.responses:
-                            self.session_data.responses[field_id] = user_message
-                            acknowledgment = "✅ Registrei sua resposta."
-                            break
+                    unanswered = _field_index_for(self.form_template).first_unanswered(self.session_data.responses)
+                    if unanswered:
+                        self.session_data.responses[unanswered[0]] = user_message
+                        acknowledgment = "✅ Registrei sua resposta."
                     else:
                         acknowledgment = "✅ Obrigado pela sua resposta."
             
@@ -982,18 +1342,14 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
                 question_prompt = await self._get_field_prompt(next_question_field)
                 
                 # Show progress
-                total_fields = len(self.form_template.get('fields', []))
+                total_fields = _field_index_for(self.form_template).total
                 completed_fields = len(self.session_data.responses)
                 progress_bar = self._create_progress_bar(completed_fields, total_fields)
                 
-                next_message_parts = [
-                    acknowledgment,
-                    f"\n📊 **Progress:** {progress_bar} ({completed_fields}/{total_fields})",
-                    "─" * 50,
-                    f"**Next Question:**\n{question_prompt}"
-                ]
-                
-                next_message = "\n\n".join(next_message_parts)
+                next_message = (
+                    f"{acknowledgment}\n\n\n📊 **Progress:** {progress_bar} ({completed_fields}/{total_fields})"
+                    f"\n\n{_QUESTION_SEPARATOR}\n\n**Next Question:**\n{question_prompt}"
+                )
                 
                 return await self._build_success_response(next_message)
             else:
@@ -1002,23 +1358,10 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
                 self.session_data.current_field = None
                 
                 # Build clean completion summary
-                summary_parts = [
-                    acknowledgment,
-                    "\n🎉 **FORMULÁRIO COMPLETO!**"
-                ]
-
-                summary_parts.append(await self._generate_response_summary(detailed=False))
-
-                summary_parts.extend([
-                    "\n" + "═" * 40,
-                    "🚀 **PRONTO PARA ENVIAR?**",
-                    "",
-                    "✅ Digite **'sim'** ou **'enviar'** para finalizar",
-                    "❌ Digite **'não'** para fazer alterações",
-                    "📋 Digite **'revisar'** para ver detalhes"
-                ])
-
-                confirmation_message = "\n".join(summary_parts)
+                summary = await self._generate_response_summary(detailed=False)
+                confirmation_message = (
+                    f"{acknowledgment}\n\n🎉 **FORMULÁRIO COMPLETO!**\n{summary}\n{_SUBMIT_PROMPT_FOOTER}"
+                )
                 
                 return await self._build_success_response(confirmation_message, is_complete=False)
                 
@@ -1031,10 +1374,7 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
         """Handle form prediction confirmation when confidence is low."""
         user_msg_lower = user_message.lower().strip()
         
-        positive_responses = ["yes", "y", "ok", "correct", "right", "proceed", "continue"]
-        negative_responses = ["no", "n", "wrong", "different", "other"]
-        
-        if any(resp in user_msg_lower for resp in positive_responses):
+        if _FORM_PICK_POSITIVE_RE.search(user_msg_lower):
             # User confirmed the form - proceed with filling
             self.session_data.state = "IN_PROGRESS" 
             
@@ -1049,75 +1389,32 @@ Which field do they want to change? Respond with just the field_id, or "UNCLEAR"
                 self.session_data.current_field = next_question_field.get("field_id")
                 question_prompt = await self._get_field_prompt(next_question_field)
                 
-                full_message = f"{confirmed_message}\n\n" + "─" * 50 + f"\n\n**Question 1:**\n{question_prompt}"
+                full_message = f"{confirmed_message}\n\n{_QUESTION_SEPARATOR}\n\n**Question 1:**\n{question_prompt}"
                 return await self._build_success_response(full_message)
             else:
                 return await self._build_success_response(f"{confirmed_message}\n\n⚠️ This form has no fields to fill.")
                 
-        elif any(resp in user_msg_lower for resp in negative_responses):
+        elif _FORM_PICK_NEGATIVE_RE.search(user_msg_lower):
             # User rejected the prediction
             self.session_data.state = "ERROR"
-            rejection_message = """❌ **No problem!** Let me try to find the right form for you.
-
-🔍 **Help me understand better:**
-• What type of form are you looking for?
-• What's the purpose of the form?
-• Which workspace or context should it be from?
-• Any specific keywords or form names?
-
-The more details you provide, the better I can help you find the correct form."""
-            
-            return await self._build_success_response(rejection_message, is_complete=True)
+            return await self._build_success_response(_FORM_PICK_REJECTED_MESSAGE, is_complete=True)
         else:
             # Unclear response - ask for clarification
-            clarification_message = """🤔 I need a clear answer to proceed:
-
-• Reply **'yes'** if this is the correct form
-• Reply **'no'** if you need a different form
-• Or provide more details about what form you're looking for
-
-Which form would you like to fill out?"""
-            
-            return await self._build_success_response(clarification_message)
+            return await self._build_success_response(_FORM_PICK_UNCLEAR_MESSAGE)
 
     async def _handle_help_request(self):
         """Provide helpful information about available commands."""
-        help_message = """🆘 **Form Assistant Help**
-
-**📝 During Form Filling:**
-• Answer questions naturally - I'll validate your responses
-• Reply **'skip'** or **'none'** for optional fields
-• Reply **'summary'** or **'review'** to see your current answers
-• Reply **'change [field]'** to modify a previous answer
-
-**🎯 Available Commands:**
-• **'help'** - Show this help message
-• **'summary'** - Review all your current responses  
-• **'change [field name]'** - Modify a specific field
-• **'skip'** - Skip optional fields
-• **'review'** - Detailed review of responses
-
-**📊 Progress Tracking:**
-• I'll show progress bars and completion status
-• Required fields are marked with 🔴
-• Optional fields are marked with ⚪
-
-**❓ Questions?** Just ask! I'm here to help make form filling easy."""
-        
-        return await self._build_success_response(help_message)
+        return await self._build_success_response(_HELP_MESSAGE)
 
     async def _handle_skip_request(self):
         """Handle requests to skip the current field."""
-        current_field_id = getattr(self.session_data, 'current_field', None)
+        current_field_id = self.session_data.current_field
         
         if not current_field_id:
             return await self._build_success_response("❓ No current question to skip. Let me continue with the next question.")
         
         # Find the current field
-        current_field = next(
-            (f for f in self.form_template.get('fields', []) if f.get('field_id') == current_field_id), 
-            None
-        )
+        current_field = _field_index_for(self.form_template).by_id.get(current_field_id)
         
         if current_field and current_field.get('required', False):
             field_label = current_field.get('label', current_field_id)
@@ -1139,7 +1436,7 @@ Which form would you like to fill out?"""
             question_prompt = await self._get_field_prompt(next_question_field)
             
             # Show progress
-            total_fields = len(self.form_template.get('fields', []))
+            total_fields = _field_index_for(self.form_template).total
             completed_fields = len(self.session_data.responses)
             progress_bar = self._create_progress_bar(completed_fields, total_fields)
             
@@ -1147,7 +1444,7 @@ Which form would you like to fill out?"""
 
 📊 **Progress:** {progress_bar} ({completed_fields}/{total_fields})
 
-{"-" * 50}
+{_SKIP_QUESTION_SEPARATOR}
 
 **Next Question:**
 {question_prompt}"""
@@ -1169,17 +1466,22 @@ Which form would you like to fill out?"""
     def _create_progress_bar(self, completed: int, total: int, width: int = 20) -> str:
         """Create a visual progress bar."""
         if total == 0:
-            return "█" * width + " 100%"
+            bar = _PROGRESS_BARS[-1] if width == _PROGRESS_BAR_WIDTH else "█" * width
+            return f"{bar} 100%"
         
         percentage = completed / total
         filled_width = int(width * percentage)
         
-        bar = "█" * filled_width + "░" * (width - filled_width)
+        if width == _PROGRESS_BAR_WIDTH and 0 <= filled_width <= width:
+            bar = _PROGRESS_BARS[filled_width]
+        else:
+            bar = "█" * filled_width + "░" * (width - filled_width)
         percent_text = f"{percentage:.0%}"
         
         return f"{bar} {percent_text}"
 
-    async def _call_external_endpoint(self, endpoint: str, method: str = "GET", data: dict = None) -> dict:
+    async def _call_external_endpoint(self, endpoint: str, method: str = "GET", data: dict = None,
+                                      params: dict = None) -> dict:
         """Make HTTP calls to external endpoints following best practices."""
         base_url = getattr(settings, 'API_BASE_URL', 'http://localhost:8000')
         full_url = f"{base_url}/{endpoint.lstrip('/')}"
@@ -1194,20 +1496,22 @@ Which form would you like to fill out?"""
             headers['Authorization'] = f"Bearer {self.session_data.auth_token}"
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                if method.upper() == "GET":
-                    response = await client.get(full_url, headers=headers)
-                elif method.upper() == "POST":
-                    response = await client.post(full_url, headers=headers, json=data)
-                elif method.upper() == "PUT":
-                    response = await client.put(full_url, headers=headers, json=data)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(full_url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                response.raise_for_status()
-                return response.json()
+            client = _get_http_client()
+            # Serialized with orjson; the Content-Type header is already set above
+            body = orjson.dumps(data) if data is not None else None
+            if method.upper() == "GET":
+                response = await client.get(full_url, headers=headers, params=params)
+            elif method.upper() == "POST":
+                response = await client.post(full_url, headers=headers, content=body)
+            elif method.upper() == "PUT":
+                response = await client.put(full_url, headers=headers, content=body)
+            elif method.upper() == "DELETE":
+                response = await client.delete(full_url, headers=headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            response.raise_for_status()
+            return orjson.loads(response.content)
                 
         except httpx.TimeoutException:
             logger.error(f"Timeout calling endpoint: {endpoint}")
@@ -1247,20 +1551,27 @@ Which form would you like to fill out?"""
         """Get similar form submissions for context."""
         if not self.session_data.form_template_id:
             return []
+
+        cache_key = (self.session_data.form_template_id, self.session_data.user_id)
+        cached = _SIMILAR_SUBMISSIONS_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _SIMILAR_SUBMISSIONS_CACHE_TTL:
+            return list(cached[1])
         
         try:
             endpoint = f"/api/v1/forms/{self.session_data.form_template_id}/similar"
+            # Sorted keys keep the encoded URL stable, so repeat queries hit the API cache
             params = {
                 "limit": 5,
                 "user_id": self.session_data.user_id
             }
             
-            # Convert params to query string for GET request
-            query_params = "&".join([f"{k}={v}" for k, v in params.items()])
-            full_endpoint = f"{endpoint}?{query_params}"
-            
-            result = await self._call_external_endpoint(full_endpoint, "GET")
-            return result.get("submissions", [])
+            result = await self._call_external_endpoint(endpoint, "GET", params=dict(sorted(params.items())))
+            submissions = result.get("submissions", [])
+            # Only successful fetches are cached; errors fall through to [] below and are retried
+            if len(_SIMILAR_SUBMISSIONS_CACHE) >= _SIMILAR_SUBMISSIONS_CACHE_MAX_SIZE:
+                _SIMILAR_SUBMISSIONS_CACHE.pop(next(iter(_SIMILAR_SUBMISSIONS_CACHE)))
+            _SIMILAR_SUBMISSIONS_CACHE[cache_key] = (time.monotonic(), submissions)
+            return list(submissions)
             
         except Exception as e:
             logger.warning(f"Could not fetch similar submissions: {e}")
@@ -1276,15 +1587,14 @@ Which form would you like to fill out?"""
         # Type-specific suggestions
         if field_type == "email":
             if "@" not in user_partial_input:
-                common_domains = ["gmail.com", "yahoo.com", "outlook.com", "company.com"]
                 if user_partial_input:
-                    suggestions = [f"{user_partial_input}@{domain}" for domain in common_domains]
+                    suggestions = [f"{user_partial_input}@{domain}" for domain in _EMAIL_DOMAINS[:_MAX_SUGGESTIONS]]
                 else:
-                    suggestions = ["user@gmail.com", "user@company.com"]
+                    suggestions = list(_EMAIL_EXAMPLES)
         
         elif field_type == "phone":
             if not user_partial_input:
-                suggestions = ["+1-555-123-4567", "(555) 123-4567", "555-123-4567"]
+                suggestions = list(_PHONE_EXAMPLES)
             elif user_partial_input.isdigit() and len(user_partial_input) >= 3:
                 # Format partial phone numbers
                 digits = user_partial_input
@@ -1293,7 +1603,6 @@ Which form would you like to fill out?"""
                     suggestions = [formatted]
         
         elif field_type == "date":
-            from datetime import datetime, timedelta
             today = datetime.now()
             suggestions = [
                 today.strftime("%Y-%m-%d"),
@@ -1304,17 +1613,21 @@ Which form would you like to fill out?"""
         elif field_type in ["select", "multiselect"]:
             options = field.get("options", [])
             if user_partial_input and options:
-                # Fuzzy matching for options
+                # Fuzzy matching for options, against the template's pre-lowered options;
+                # stops as soon as the three suggestions returned below are found
                 user_lower = user_partial_input.lower()
-                suggestions = [opt for opt in options if user_lower in opt.lower()]
+                suggestions = list(islice(
+                    (opt for opt, opt_lower in self._lowered_options_for(field) if user_lower in opt_lower),
+                    _MAX_SUGGESTIONS,
+                ))
         
         # Field-specific suggestions based on common field names
         elif "name" in field_id.lower():
             if not user_partial_input:
-                suggestions = ["John Doe", "Jane Smith", "[Your full name]"]
+                suggestions = list(_NAME_EXAMPLES)
         
         elif "company" in field_id.lower() or "organization" in field_id.lower():
             if not user_partial_input:
-                suggestions = ["Acme Corp", "Tech Solutions Inc", "[Your company name]"]
+                suggestions = list(_COMPANY_EXAMPLES)
         
-        return suggestions[:3]  # Limit to top 3 suggestions
\ No newline at end of file
+        return suggestions[:_MAX_SUGGESTIONS]  # Limit to top 3 suggestions
\ No newline at end of file
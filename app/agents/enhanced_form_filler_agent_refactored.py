@@ -7,9 +7,8 @@ that uses separate modules for validation, form management, and prompts.
 
 import logging
 import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any
-from bson import ObjectId
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
 
 from app.sessions.session_manager import EnhancedBaseAgent, SessionData
 from app.utils.langchain_utils import get_gemini_llm
@@ -21,6 +20,9 @@ from app.core.exceptions import ValidationError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# FieldValidator holds no per-session state, so every agent shares one
+_FIELD_VALIDATOR = FieldValidator()
+
 
 class EnhancedFormFillerAgent(EnhancedBaseAgent):
     """
@@ -30,18 +32,37 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
     providing validation, suggestions, and guidance throughout the process.
     """
 
+    # Whole-message commands -> handler method name; 'edit <field>' is matched by prefix
+    _COMMAND_DISPATCH: Dict[str, str] = {
+        'help': '_handle_help_command',
+        '?': '_handle_help_command',
+        'submit': '_handle_submit_command',
+        'review': '_handle_review_command',
+        'skip': '_handle_skip_command',
+        'next': '_handle_skip_command',
+        'cancel': '_handle_cancel_command',
+        'quit': '_handle_cancel_command',
+        'exit': '_handle_cancel_command',
+        'restart': '_handle_restart_command',
+    }
+
     def __init__(self, db, session_data: SessionData):
         super().__init__(db, session_data)
         self.llm = get_gemini_llm()
 
         # Initialize modular components
-        self.validator = FieldValidator()
+        self.validator = _FIELD_VALIDATOR
         self.form_manager = FormTemplateManager(db)
         self.prompt_manager = FormPromptManager()
 
         # Agent state
         self.form_template = None
         self.context_info = None
+        # Lowercased label and field_id -> field, for 'edit <name>'
+        self._field_by_key: Dict[str, Dict] = {}
+        # Required fields as (field_id, label) in template order, and their ids
+        self._required_fields: List[Tuple[str, str]] = []
+        self._required_field_ids: frozenset = frozenset()
         self.current_field = None
         self.waiting_for_confirmation = False
 
@@ -88,6 +109,7 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
 
             # Load form template
             self.form_template = await self.form_manager.load_form_template(template_id)
+            self._index_fields()
 
             # Load context if available
             context_id = self.form_template.get('context_id')
@@ -100,6 +122,24 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
             logger.error(f"Error loading form data: {str(e)}")
             raise NotFoundError("form template", self.session_data.form_template_id)
 
+    def _index_fields(self):
+        """
+        Build per-template lookups: lowercased labels and field_ids to their fields
+        (the first field wins a shared key), and the required fields.
+        """
+        fields = self.form_template.get('fields', [])
+        self._field_by_key = {}
+        for field in fields:
+            self._field_by_key.setdefault(field.get('label', '').lower(), field)
+            self._field_by_key.setdefault(field.get('field_id', '').lower(), field)
+
+        self._required_fields = [
+            (field.get('field_id'), field.get('label', field.get('field_id')))
+            for field in fields
+            if field.get('required', False)
+        ]
+        self._required_field_ids = frozenset(field_id for field_id, _ in self._required_fields)
+
     async def _handle_user_input(self, user_input: str) -> str:
         """
         Handle user input based on current state and intent.
@@ -111,28 +151,14 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
             Response message
         """
         # Handle special commands
-        if user_input in ['help', '?']:
-            return self.prompt_manager.generate_help_prompt(self.current_field)
-
-        elif user_input == 'submit':
-            return await self._handle_submit_command()
-
-        elif user_input == 'review':
-            return await self._handle_review_command()
+        handler_name = self._COMMAND_DISPATCH.get(user_input)
+        if handler_name:
+            return await getattr(self, handler_name)()
 
         elif user_input.startswith('edit '):
             field_name = user_input[5:].strip()
             return await self._handle_edit_command(field_name)
 
-        elif user_input in ['skip', 'next']:
-            return await self._handle_skip_command()
-
-        elif user_input in ['cancel', 'quit', 'exit']:
-            return await self._handle_cancel_command()
-
-        elif user_input == 'restart':
-            return await self._handle_restart_command()
-
         # Handle confirmation responses
         elif self.waiting_for_confirmation:
             return await self._handle_confirmation_response(user_input)
@@ -210,24 +236,21 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
             self.form_template
         )
 
+    async def _handle_help_command(self) -> str:
+        """Handle help command for the current field."""
+        return self.prompt_manager.generate_help_prompt(self.current_field)
+
     async def _handle_submit_command(self) -> str:
         """Handle form submission."""
         if not self.session_data.responses:
             return "You haven't filled out any fields yet. Let me help you get started."
 
         # Check if required fields are completed
-        required_fields = [
-            f for f in self.form_template.get('fields', [])
-            if f.get('required', False)
-        ]
+        missing_ids = self._required_field_ids - self.session_data.responses.keys()
 
-        missing_required = []
-        for field in required_fields:
-            field_id = field.get('field_id')
-            if field_id not in self.session_data.responses:
-                missing_required.append(field.get('label', field_id))
-
-        if missing_required:
+        if missing_ids:
+            # Listed in template order
+            missing_required = [label for field_id, label in self._required_fields if field_id in missing_ids]
             return f"Please complete these required fields first: {', '.join(missing_required)}"
 
         # Submit the form
@@ -236,14 +259,18 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
     async def _submit_form(self) -> str:
         """Submit the form to the database."""
         try:
-            # Create form response document
+            if self.session_data.form_template_oid is None or self.session_data.user_oid is None:
+                raise ValueError("Session has an invalid form template or user id")
+
+            # Create form response document; one clock read for both timestamps
+            now = datetime.now(timezone.utc)
             form_response = {
-                "form_template_id": ObjectId(self.session_data.form_template_id),
-                "user_id": ObjectId(self.session_data.user_id),
+                "form_template_id": self.session_data.form_template_oid,
+                "user_id": self.session_data.user_oid,
                 "responses": self.session_data.responses,
                 "status": "submitted",
-                "submitted_at": datetime.utcnow(),
-                "created_at": datetime.utcnow(),
+                "submitted_at": now,
+                "created_at": now,
                 "session_id": self.session_data.session_id
             }
 
@@ -280,14 +307,7 @@ class EnhancedFormFillerAgent(EnhancedBaseAgent):
     async def _handle_edit_command(self, field_name: str) -> str:
         """Handle edit command for a specific field."""
         # Find the field by name or ID
-        fields = self.form_template.get('fields', [])
-        target_field = None
-
-        for field in fields:
-            if (field.get('label', '').lower() == field_name or
-                field.get('field_id', '').lower() == field_name):
-                target_field = field
-                break
+        target_field = self._field_by_key.get(field_name)
 
         if not target_field:
             return f"I couldn't find a field named '{field_name}'. Use 'review' to see all fields."
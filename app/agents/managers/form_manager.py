@@ -8,6 +8,8 @@ import logging
 from typing import Dict, Optional, Any
 from bson import ObjectId
 
+from app.utils.document_cache import get_cached_document, invalidate_cached_document
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,8 +47,10 @@ class FormTemplateManager:
             if not ObjectId.is_valid(template_id):
                 raise ValueError(f"Invalid template ID format: {template_id}")
 
-            # Load from database
-            form_template = await self.db.form_templates.find_one({"_id": ObjectId(template_id)})
+            # Load through the process-wide document cache shared by all agent instances
+            if force_reload:
+                invalidate_cached_document("form_templates", template_id)
+            form_template = await get_cached_document(self.db, "form_templates", template_id)
 
             if not form_template:
                 raise ValueError(f"Form template with ID {template_id} not found.")
@@ -88,8 +92,10 @@ class FormTemplateManager:
                 logger.warning(f"Invalid context ID format: {context_id}")
                 return None
 
-            # Load from database
-            context = await self.db.contexts.find_one({"_id": ObjectId(context_id)})
+            # Load through the process-wide document cache shared by all agent instances
+            if force_reload:
+                invalidate_cached_document("contexts", context_id)
+            context = await get_cached_document(self.db, "contexts", context_id)
 
             if context:
                 # Cache the context
@@ -5,7 +5,7 @@ Clarification node for handling unclear user requests.
 import logging
 
 from ..base import BaseNode, state_get
-from ..types import StateType, ResponseType, NodeResponse, NodeType
+from ..types import StateType, NodeResponse, NodeType
 from app.utils.confidence_system import ConfidenceManager
 
 logger = logging.getLogger(__name__)
@@ -17,12 +17,14 @@ class ClarificationNode(BaseNode):
     Handles cases where user intent is unclear or requires additional information.
     """
 
+    REQUIRED_STATE_KEYS = frozenset()  # No required keys for clarification
+
     def __init__(self):
         """Initialize clarification node."""
         super().__init__(NodeType.CLARIFICATION, "clarification_handler")
         self.confidence_manager = ConfidenceManager()
 
-    async def execute(self, state: StateType) -> ResponseType:
+    async def execute(self, state: StateType) -> NodeResponse:
         """
         Generate clarification response with context awareness.
 
@@ -64,8 +66,4 @@ Preencher um formulário - Posso ajudá-lo a encontrar o formulário certo e gui
 Buscar formulários existentes - Posso ajudá-lo a encontrar formulários ou respostas enviados anteriormente
 Gerar relatórios - Posso criar resumos e análises de dados de formulários
 
-Você pode me dizer qual destes você gostaria de fazer, ou fornecer mais detalhes específicos sobre o que você precisa?"""
-
-    def _get_required_state_keys(self) -> list:
-        """Get required state keys for clarification."""
-        return []  # No required keys for clarification
\ No newline at end of file
+Você pode me dizer qual destes você gostaria de fazer, ou fornecer mais detalhes específicos sobre o que você precisa?"""
\ No newline at end of file
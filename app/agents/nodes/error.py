@@ -5,7 +5,7 @@ Error handling node for managing system errors and recovery.
 import logging
 
 from ..base import BaseNode, state_get
-from ..types import StateType, ResponseType, NodeResponse, NodeType
+from ..types import StateType, NodeResponse, NodeType
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +16,13 @@ class ErrorNode(BaseNode):
     Provides user-friendly error messages and guides users back to productive workflows.
     """
 
+    REQUIRED_STATE_KEYS = frozenset()  # No required keys for error handling
+
     def __init__(self):
         """Initialize error node."""
         super().__init__(NodeType.ERROR, "error")
 
-    async def execute(self, state: StateType) -> ResponseType:
+    async def execute(self, state: StateType) -> NodeResponse:
         """
         Handle errors with contextual messages and recovery suggestions.
 
@@ -77,8 +79,4 @@ Deixe-me ajudá-lo a voltar ao caminho certo. Você pode:
 • Buscar formulários enviados existentes
 • Perguntar sobre o que posso fazer
 
-O que você gostaria de tentar?"""
-
-    def _get_required_state_keys(self) -> list:
-        """Get required state keys for error handling."""
-        return []  # No required keys for error handling
\ No newline at end of file
+O que você gostaria de tentar?"""
\ No newline at end of file
@@ -6,9 +6,9 @@ import logging
 from typing import Dict, Any
 
 from ..base import BaseNode, state_get
-from ..types import StateType, ResponseType, NodeResponse, NodeType
+from ..types import StateType, NodeResponse, NodeType
 from app.agents.enhanced_form_filler_agent import EnhancedFormFillerAgent
-from app.sessions.session_manager import SessionManager, SessionState
+from app.sessions.session_manager import SessionManager, SessionState, session_state_value
 from app.database import db
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ class FormFillerNode(BaseNode):
         super().__init__(NodeType.FORM_FILLER, "form_filler")
         self.session_manager = session_manager
 
-    async def execute(self, state: StateType) -> ResponseType:
+    async def execute(self, state: StateType) -> NodeResponse:
         """
         Execute form filling logic with comprehensive error handling.
 
@@ -100,7 +100,7 @@ class FormFillerNode(BaseNode):
             # Process the interaction based on session state
             self.logger.info(f"🔍 FORM_FILLER_NODE: session_state={session_data.state}, user_message='{user_message}'")
 
-            if getattr(session_data, "state", None) == SessionState.STARTING or session_data.state == "STARTING":
+            if session_data.state == SessionState.STARTING:
                 self.logger.info(f"Starting new form conversation for session {session_id}")
                 response = await agent.start_conversation()
             else:
@@ -158,9 +158,5 @@ class FormFillerNode(BaseNode):
             confidence_score=confidence_score,
             chat_history=getattr(session_data, 'conversation_history', []),
             responses_count=len(getattr(session_data, 'responses', {})),
-            session_state=getattr(session_data, 'state', {}).value if hasattr(getattr(session_data, 'state', {}), 'value') else str(getattr(session_data, 'state', 'unknown'))
-        )
-
-    def _get_required_state_keys(self) -> list:
-        """Get required state keys for form filling."""
-        return ["session_id", "user_message"]
\ No newline at end of file
+            session_state=session_state_value(getattr(session_data, 'state', None)) or 'unknown'
+        )
\ No newline at end of file
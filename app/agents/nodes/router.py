@@ -6,7 +6,7 @@ from typing import Optional
 import logging
 
 from ..base import BaseNode, state_get
-from ..types import StateType, ResponseType, NodeResponse, NodeType
+from ..types import StateType, NodeResponse, NodeType
 from app.utils.langchain_utils import get_gemini_llm
 from app.sessions.session_manager import SessionManager
 
@@ -19,6 +19,8 @@ class RouterNode(BaseNode):
     Routes user messages to appropriate agent nodes based on intent and context.
     """
 
+    REQUIRED_STATE_KEYS = frozenset({"session_id"})  # user_message is optional for routing
+
     def __init__(self, session_manager: Optional[SessionManager] = None):
         """
         Initialize router node.
@@ -30,7 +32,7 @@ class RouterNode(BaseNode):
         self.llm = get_gemini_llm()
         self.session_manager = session_manager
 
-    async def execute(self, state: StateType) -> ResponseType:
+    async def execute(self, state: StateType) -> NodeResponse:
         """
         Route user message to appropriate node.
 
@@ -148,12 +150,8 @@ Responda com APENAS o nome da categoria (fill_form, search_forms, generate_repor
         """
         if self.session_manager and session_id:
             try:
-                return await self.session_manager.get_session(session_id)
+                return await self.session_manager.get_cached_session(session_id)
             except Exception as e:
                 self.logger.error(f"Error retrieving session data: {e}")
                 return None
-        return None
-
-    def _get_required_state_keys(self) -> list:
-        """Get required state keys for routing."""
-        return ["session_id"]  # user_message is optional for routing
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -3,24 +3,24 @@ Conversation graph orchestrator for managing agent workflow.
 """
 
 import logging
-from datetime import datetime
+import time
 from typing import Dict, Any
 
 from langgraph.graph import StateGraph, END
 
-from .types import FormState, NodeResponse
+from .types import NodeResponse
 from .base import state_get
 from .nodes import RouterNode, ClarificationNode, FormFillerNode, ErrorNode
 from .enhanced_form_predictor_node import EnhancedFormPredictorNode
 from .form_searcher_node import FormSearcherNode
 from .report_generator_node import ReportGeneratorNode
+from .routing import DEFAULT_FORM_STATE, ROUTER_EDGES, PREDICTOR_ROUTE_TABLE, has_form_template_id
 from app.sessions.session_manager import SessionManager
 from app.utils.observability import ObservabilityMixin, monitor
 from app.utils.confidence_system import ConfidenceManager
 
 logger = logging.getLogger(__name__)
 
-
 class ConversationGraphOrchestrator(ObservabilityMixin):
     """
     Enhanced orchestrator with better state management and error handling.
@@ -73,14 +73,7 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
         workflow.add_conditional_edges(
             "router",
             self._router_decision,
-            {
-                "form_predictor": "form_predictor",
-                "form_filler": "form_filler",
-                "clarification_handler": "clarification_handler",
-                "form_searcher": "form_searcher",
-                "report_generator": "report_generator",
-                "error": "error",
-            },
+            ROUTER_EDGES,
         )
 
         # Enhanced form predictor conditional edges
@@ -117,7 +110,7 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
                 # Log session info for debugging
                 node_name = getattr(node_instance, 'name', node_instance.__class__.__name__)
                 session_id = state_get(state, "session_id") if hasattr(state, 'get') or hasattr(state, '__getitem__') else None
-                logger.info(f"🔍 WRAPPED_NODE: {node_name} executing with session_id='{session_id}'")
+                logger.info("🔍 WRAPPED_NODE: %s executing with session_id='%s'", node_name, session_id)
 
                 # Call the node's run method
                 response = await node_instance.run(state)
@@ -144,10 +137,10 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
 
             except Exception as e:
                 node_name = getattr(node_instance, 'name', node_instance.__class__.__name__)
-                logger.exception(f"Error in wrapped node {node_name}: {e}")
+                logger.exception("Error in wrapped node %s: %s", node_name, e)
                 # Preserve ALL essential state when error occurs
                 session_id = state_get(state, "session_id") if hasattr(state, 'get') or hasattr(state, '__getitem__') else None
-                logger.error(f"🚨 WRAPPED_NODE: {node_name} failed with session_id='{session_id}', error: {e}")
+                logger.error("🚨 WRAPPED_NODE: %s failed with session_id='%s', error: %s", node_name, session_id, e)
                 return {
                     "session_id": state_get(state, "session_id"),
                     "user_id": state_get(state, "user_id"),
@@ -172,10 +165,10 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
         """
         try:
             next_node = state_get(state, "next_node", "error")
-            logger.debug(f"Router decision: {next_node}")
-            return next_node
+            logger.debug("Router decision: %s", next_node)
+            return next_node if next_node in ROUTER_EDGES else "error"
         except Exception as e:
-            logger.error(f"Error in router decision: {e}")
+            logger.error("Error in router decision: %s", e)
             return "error"
 
     def _form_predictor_router(self, state) -> str:
@@ -194,21 +187,18 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
             requires_clarification = state_get(state, "requires_clarification", False)
 
             logger.debug(
-                f"Form predictor router - form_id: {form_template_id}, "
-                f"error: {error_message}, clarification: {requires_clarification}"
+                "Form predictor router - form_id: %s, error: %s, clarification: %s",
+                form_template_id, error_message, requires_clarification
             )
 
-            if error_message:
-                return "error"
-            elif requires_clarification:
-                return "form_filler"  # Form filler can handle clarification
-            elif form_template_id is not None and str(form_template_id).strip() != "":
-                return "form_filler"
-            else:
-                return "error"
+            return PREDICTOR_ROUTE_TABLE[(
+                bool(error_message),
+                bool(requires_clarification),
+                has_form_template_id(form_template_id),
+            )]
 
         except Exception as e:
-            logger.error(f"Error in form predictor router: {e}")
+            logger.error("Error in form predictor router: %s", e)
             return "error"
 
     @monitor
@@ -225,44 +215,41 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
         session_id = initial_state.get("session_id", "unknown")
 
         try:
-            logger.info(f"📍 ORCHESTRATOR: ENTRY - Starting graph execution for session {session_id}")
-            logger.info(f"📍 ORCHESTRATOR: Initial state keys: {list(initial_state.keys())}")
-            logger.info(f"📍 ORCHESTRATOR: user_message='{initial_state.get('user_message')}', session_id='{initial_state.get('session_id')}'")
+            logger.info("📍 ORCHESTRATOR: ENTRY - Starting graph execution for session %s", session_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📍 ORCHESTRATOR: Initial state keys: %s", list(initial_state.keys()))
+            logger.info("📍 ORCHESTRATOR: user_message='%s', session_id='%s'", initial_state.get('user_message'), initial_state.get('session_id'))
 
             # Ensure required state fields are present with proper defaults
             enhanced_state = {
-                "initial_confidence_score": 1.0,
-                "confidence_level": "high",
-                "timestamp": datetime.utcnow().isoformat(),
-                "current_field": None,
+                **DEFAULT_FORM_STATE,
+                # Epoch seconds; format at the sink if an ISO string is ever needed
+                "timestamp": time.time(),
+                # Mutable defaults are created per invocation so runs never share them
                 "responses": {},
                 "completed_fields": [],
                 "missing_required_fields": [],
                 "chat_history": [],
-                "state": "STARTING",
-                "is_complete": False,
-                "final_response": None,
-                "error_message": None,
-                "next_node": None,
                 **initial_state
             }
 
             # Debug: Log enhanced state before graph execution
-            logger.info(f"🔍 ORCHESTRATOR: Enhanced state keys: {list(enhanced_state.keys())}")
-            logger.info(f"🔍 ORCHESTRATOR: About to execute graph with user_message='{enhanced_state.get('user_message')}', session_id='{enhanced_state.get('session_id')}'")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🔍 ORCHESTRATOR: Enhanced state keys: %s", list(enhanced_state.keys()))
+            logger.info("🔍 ORCHESTRATOR: About to execute graph with user_message='%s', session_id='%s'", enhanced_state.get('user_message'), enhanced_state.get('session_id'))
 
             # Execute the graph
-            logger.info(f"📍 ORCHESTRATOR: About to call graph.ainvoke() with session_id='{enhanced_state.get('session_id')}'")
+            logger.info("📍 ORCHESTRATOR: About to call graph.ainvoke() with session_id='%s'", enhanced_state.get('session_id'))
             final_state = await self.graph.ainvoke(enhanced_state)
-            logger.info(f"📍 ORCHESTRATOR: Graph.ainvoke() returned, final_state session_id='{final_state.get('session_id') if final_state else None}'")
+            logger.info("📍 ORCHESTRATOR: Graph.ainvoke() returned, final_state session_id='%s'", final_state.get('session_id') if final_state else None)
 
             if not final_state:
-                logger.error(f"Graph returned None state for session {session_id}")
+                logger.error("Graph returned None state for session %s", session_id)
                 return self._create_error_state(session_id, "Graph execution returned None")
 
             # Validate final state has required fields
             if not state_get(final_state, "final_response"):
-                logger.warning(f"No final_response in final state for session {session_id}")
+                logger.warning("No final_response in final state for session %s", session_id)
                 # Try to extract from other possible fields
                 response = (
                     state_get(final_state, "message") or
@@ -272,11 +259,11 @@ class ConversationGraphOrchestrator(ObservabilityMixin):
                 )
                 final_state["final_response"] = response
 
-            logger.info(f"Graph execution completed successfully for session {session_id}")
+            logger.info("Graph execution completed successfully for session %s", session_id)
             return final_state
 
         except Exception as e:
-            logger.exception(f"Graph execution failed for session {session_id}: {e}")
+            logger.exception("Graph execution failed for session %s: %s", session_id, e)
             return self._create_error_state(session_id, str(e))
 
     def _create_error_state(self, session_id: str, error_message: str) -> Dict[str, Any]:
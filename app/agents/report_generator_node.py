@@ -692,8 +692,4 @@ Just let me know what interests you most!"""
                 seen.add(kw)
                 unique_keywords.append(kw)
 
-        return unique_keywords
-
-    def _get_required_state_keys(self) -> list:
-        """Get required state keys for report generation."""
-        return ["session_id", "user_message"]
\ No newline at end of file
+        return unique_keywords
\ No newline at end of file
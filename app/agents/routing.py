@@ -0,0 +1,46 @@
+"""
+Routing tables shared by the conversation graphs.
+
+Both the orchestrator graph and the legacy graph in app/agents/__init__.py
+import these, so the two stay in step.
+"""
+
+# Immutable defaults merged into every graph invocation's initial state
+DEFAULT_FORM_STATE = {
+    "initial_confidence_score": 1.0,
+    "confidence_level": "high",
+    "current_field": None,
+    "state": "STARTING",
+    "is_complete": False,
+    "final_response": None,
+    "error_message": None,
+    "next_node": None,
+}
+
+# Router edge targets; unknown next_node values fall back to the error node
+ROUTER_EDGES = {
+    "form_predictor": "form_predictor",
+    "form_filler": "form_filler",
+    "clarification_handler": "clarification_handler",
+    "form_searcher": "form_searcher",
+    "report_generator": "report_generator",
+    "error": "error",
+}
+
+# Form predictor edge routing keyed by (has_error, requires_clarification, has_form_template).
+# Errors win; the form filler handles clarification and known templates.
+PREDICTOR_ROUTE_TABLE = {
+    (True, True, True): "error",
+    (True, True, False): "error",
+    (True, False, True): "error",
+    (True, False, False): "error",
+    (False, True, True): "form_filler",
+    (False, True, False): "form_filler",
+    (False, False, True): "form_filler",
+    (False, False, False): "error",
+}
+
+
+def has_form_template_id(form_template_id):
+    """A template id counts only when it is present and not blank."""
+    return form_template_id is not None and str(form_template_id).strip() != ""
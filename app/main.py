@@ -1,5 +1,6 @@
 # app/main.py
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from app.database import db, close_mongo_connection, connect_to_mongo
@@ -23,6 +24,7 @@ from app.middleware import (
     generic_exception_handler,
 )
 from app.cache import cache
+from app.agents.enhanced_form_filler_agent import close_http_client
 from contextlib import asynccontextmanager
 
 @asynccontextmanager
@@ -51,9 +53,11 @@ async def lifespan(app: FastAPI):
     await app.state.session_manager.stop_cleanup_task()
     await app.state.redis_manager.close_redis()
     await cache.disconnect()
+    await close_http_client()
 
 
-app = FastAPI(lifespan=lifespan)
+# orjson encodes the chat-history-heavy conversation payloads much faster than stdlib json
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Add error handling middleware
 app.add_middleware(ErrorHandlingMiddleware)
@@ -16,6 +16,7 @@ from app.core.exceptions import AuthenticationError, ValidationError
 from app.services.base_service import BaseService
 from app.database import get_redis
 from app.config.settings import settings
+from app.utils.db_indexes import CASE_INSENSITIVE_COLLATION
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +44,7 @@ class AuthService(BaseService):
         if user_create.phone_number is not None:
             query_conditions.append({"phone_number": user_create.phone_number})
         
-        if await self.db.users.find_one({"$or": query_conditions}):
+        if await self.db.users.find_one({"$or": query_conditions}, collation=CASE_INSENSITIVE_COLLATION):
             raise ValidationError("User with this email or phone number already exists.")
 
         hashed_password = get_password_hash(user_create.password)
@@ -72,7 +73,7 @@ class AuthService(BaseService):
     async def authenticate_user(self, identifier: str, password: str) -> Optional[Dict[str, Any]]:
         """Authenticates a user by checking email or phone number and password. Returns user data if successful."""
         # First try email
-        user_data = await self.db.users.find_one({"email": identifier})
+        user_data = await self.db.users.find_one({"email": identifier}, collation=CASE_INSENSITIVE_COLLATION)
         # If not found by email, try phone number
         if not user_data:
             user_data = await self.db.users.find_one({"phone_number": identifier})
@@ -165,7 +166,7 @@ class AuthService(BaseService):
                 if is_revoked:
                     raise AuthenticationError("Refresh token has been revoked.")
             
-            user_data = await self.db.users.find_one({"email": payload.sub})
+            user_data = await self.db.users.find_one({"email": payload.sub}, collation=CASE_INSENSITIVE_COLLATION)
             if not user_data or not user_data.get("is_active"):
                 raise AuthenticationError("User not found or is inactive.")
 
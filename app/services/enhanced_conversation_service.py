@@ -131,7 +131,7 @@ class EnhancedConversationService(BaseService):
                 "form_template_id": effective_form_template_id,
                 "user_token": user_token,
                 "api_client": self.internal_client,
-                "session_state": session_data.state.value if isinstance(session_data.state, SessionState) else session_data.state,
+                "session_state": session_data.state.value,
                 "conversation_history": getattr(session_data, 'conversation_history', []),
                 "file_contents": file_contents,  # Add file contents to state
                 # Initialize other fields that may be expected by the graph
@@ -140,7 +140,7 @@ class EnhancedConversationService(BaseService):
                 "completed_fields": [],
                 "missing_required_fields": getattr(session_data, 'missing_required_fields', []),
                 "chat_history": getattr(session_data, 'conversation_history', []),
-                "state": getattr(session_data, 'state', SessionState.STARTING).value if isinstance(getattr(session_data, 'state', SessionState.STARTING), SessionState) else getattr(session_data, 'state', SessionState.STARTING),
+                "state": session_data.state.value,
                 "is_complete": False,
                 "final_response": None,
                 "error_message": None,
@@ -13,6 +13,7 @@ from app.schemas.forms import (
     FormResponseCreate, FormResponseUpdate, FormResponseResponse
 )
 from app.core.exceptions import NotFoundError, ValidationError, PermissionError
+from app.utils.document_cache import invalidate_cached_document
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,7 @@ class ContextManager:
         update_data["updated_at"] = datetime.utcnow()
 
         result = await self.db.contexts.update_one({"_id": ObjectId(context_id)}, {"$set": update_data})
+        invalidate_cached_document("contexts", context_id)
         if result.matched_count == 0:
             raise NotFoundError("Context not found.")
         
@@ -62,6 +64,7 @@ class ContextManager:
             {"_id": ObjectId(context_id)},
             {"$set": {"is_active": False, "updated_at": datetime.utcnow()}}
         )
+        invalidate_cached_document("contexts", context_id)
         if result.matched_count == 0:
             raise NotFoundError("Context not found.")
         return True
@@ -97,6 +100,7 @@ class FormTemplateManager:
         update_data["updated_at"] = datetime.utcnow()
 
         result = await self.db.form_templates.update_one({"_id": ObjectId(template_id)}, {"$set": update_data})
+        invalidate_cached_document("form_templates", template_id)
         if result.matched_count == 0:
             raise NotFoundError("Form template not found.")
             
@@ -111,6 +115,7 @@ class FormTemplateManager:
             {"_id": ObjectId(template_id)},
             {"$set": {"status": FormStatus.ARCHIVED.value, "updated_at": datetime.utcnow()}}
         )
+        invalidate_cached_document("form_templates", template_id)
         if result.matched_count == 0:
             raise NotFoundError("Form template not found.")
         return True
@@ -280,6 +285,7 @@ class FormsService(BaseService):
             {"_id": ObjectId(context_id)},
             {"$set": {field_name: new_assigned}}
         )
+        invalidate_cached_document("contexts", context_id)
 
         return {
             "message": f"Successfully assigned {len(user_ids)} users as {assign_type} to context",
@@ -314,6 +320,7 @@ class FormsService(BaseService):
                 {"_id": ObjectId(context_id)},
                 {"$set": update_doc}
             )
+            invalidate_cached_document("contexts", context_id)
 
         return {
             "message": f"Successfully removed user {user_id} from context",
@@ -9,6 +9,7 @@ from app.models.enums import UserRole
 from app.schemas.user import UserUpdate, UserResponse
 from app.core.security import get_password_hash
 from app.core.exceptions import NotFoundError, ValidationError, PermissionError
+from app.utils.db_indexes import CASE_INSENSITIVE_COLLATION
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,8 @@ class UserService(BaseService):
         # Check for email uniqueness if email is being changed
         if "email" in update_data:
             existing_user = await self.db.users.find_one(
-                {"email": update_data["email"], "_id": {"$ne": ObjectId(user_id)}}
+                {"email": update_data["email"], "_id": {"$ne": ObjectId(user_id)}},
+                collation=CASE_INSENSITIVE_COLLATION,
             )
             if existing_user:
                 raise ValidationError("This email address is already in use.")
@@ -1,15 +1,21 @@
 # app/sessions/session_manager_fixed.py
-import json
 import logging
 import asyncio
+import time
+import orjson
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from uuid import uuid4
+from bson import ObjectId
+from bson.errors import InvalidId
 from enum import Enum
 from app.utils.observability import ObservabilityMixin, monitor
 
 logger = logging.getLogger(__name__)
 
+# Redis TTL for serialized sessions (2 hours)
+SESSION_TTL_SECONDS = 120 * 60
+
 
 class EnhancedBaseAgent(ObservabilityMixin):
     """Base agent class providing common functionality for all agents."""
@@ -142,12 +148,10 @@ class RedisManager:
         """Save session to Redis with TTL."""
         try:
             redis_client = await self.get_redis()
-            import json
-            session_dict = session_data.to_dict()
             await redis_client.setex(
                 f"session:{session_data.session_id}",
-                120 * 60,  # TTL in seconds (2 hours)
-                json.dumps(session_dict, default=str)
+                SESSION_TTL_SECONDS,
+                session_data.to_json()
             )
             return True
         except Exception as e:
@@ -160,8 +164,7 @@ class RedisManager:
             redis_client = await self.get_redis()
             session_data_json = await redis_client.get(f"session:{session_id}")
             if session_data_json:
-                import json
-                session_dict = json.loads(session_data_json)
+                session_dict = orjson.loads(session_data_json)
                 return SessionData.from_dict(session_dict)
             return None
         except Exception as e:
@@ -249,6 +252,13 @@ class SessionState(Enum):
     EXPIRED = "EXPIRED"
 
 
+def session_state_value(state) -> Optional[str]:
+    """Return the string value of a session state, whether given as a SessionState or a raw value."""
+    if isinstance(state, SessionState):
+        return state.value
+    return str(state) if state else None
+
+
 class SessionData:
     """Enhanced session data with better timeout handling"""
     
@@ -259,16 +269,8 @@ class SessionData:
         self.created_at = kwargs.get('created_at', datetime.utcnow())
         self.last_activity = kwargs.get('last_activity', datetime.utcnow())
         
-        # Enhanced state handling
-        state = kwargs.get('state', SessionState.STARTING.value)
-        if isinstance(state, SessionState):
-            self.state = state
-        else:
-            try:
-                self.state = SessionState(state.upper() if isinstance(state, str) else state)
-            except ValueError:
-                logger.warning(f"Invalid state value: {state}, defaulting to IN_PROGRESS")
-                self.state = SessionState.IN_PROGRESS
+        # Enhanced state handling (coerced to SessionState by the property setter)
+        self.state = kwargs.get('state', SessionState.STARTING)
         
         self.responses = kwargs.get('responses', {})
         self.missing_required_fields = kwargs.get('missing_required_fields', [])
@@ -284,6 +286,47 @@ class SessionData:
         self.activity_count = kwargs.get('activity_count', 0)
         self.last_user_message = kwargs.get('last_user_message', '')
 
+        # Parsed ObjectIds, memoized per raw id; see _object_id
+        self._oid_cache: Dict[str, Optional[ObjectId]] = {}
+
+    def _object_id(self, value) -> Optional[ObjectId]:
+        """Parse a stored id once; ObjectIds pass through, invalid ids become None."""
+        if value is None or isinstance(value, ObjectId):
+            return value
+        if value not in self._oid_cache:
+            try:
+                self._oid_cache[value] = ObjectId(value)
+            except (InvalidId, TypeError):
+                self._oid_cache[value] = None
+        return self._oid_cache[value]
+
+    @property
+    def form_template_oid(self) -> Optional[ObjectId]:
+        """form_template_id as an ObjectId (tracks reassignment of the raw id)."""
+        return self._object_id(self.form_template_id)
+
+    @property
+    def user_oid(self) -> Optional[ObjectId]:
+        """user_id as an ObjectId."""
+        return self._object_id(self.user_id)
+
+    @property
+    def state(self) -> SessionState:
+        """Current session state, always a SessionState member."""
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        """Accept SessionState members or their string values; strings are coerced once here."""
+        if isinstance(value, SessionState):
+            self._state = value
+            return
+        try:
+            self._state = SessionState(value.upper() if isinstance(value, str) else value)
+        except ValueError:
+            logger.warning(f"Invalid state value: {value}, defaulting to IN_PROGRESS")
+            self._state = SessionState.IN_PROGRESS
+
     def update_activity(self):
         """Update session activity timestamp and counter."""
         self.last_activity = datetime.utcnow()
@@ -337,7 +380,7 @@ class SessionData:
             'form_template_id': self.form_template_id,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'last_activity': self.last_activity.isoformat() if self.last_activity else None,
-            'state': self.state.value if isinstance(self.state, SessionState) else self.state,
+            'state': self.state.value,
             'responses': self.responses,
             'missing_required_fields': self.missing_required_fields,
             'conversation_history': self.conversation_history,
@@ -351,18 +394,19 @@ class SessionData:
             'last_user_message': self.last_user_message
         }
 
+    def to_json(self, data: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Serialize to_dict() for Redis; str() covers any non-JSON values in nested data.
+        Pass an already-built to_dict() result to skip rebuilding it.
+        """
+        return orjson.dumps(self.to_dict() if data is None else data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionData":
         """Enhanced deserialization with better error handling."""
         try:
-            # Convert state
-            if 'state' in data:
-                try:
-                    data['state'] = SessionState(data['state']) if isinstance(data['state'], str) else data['state']
-                except ValueError:
-                    logger.warning(f"Invalid state in data: {data['state']}, defaulting to IN_PROGRESS")
-                    data['state'] = SessionState.IN_PROGRESS
-            
+            # State strings are coerced to SessionState by the SessionData.state setter
+
             # Convert datetime strings
             datetime_fields = ['created_at', 'last_activity', 'updated_at', 'completed_at']
             for field in datetime_fields:
@@ -397,6 +441,11 @@ class SessionManager(ObservabilityMixin):
         self.session_timeout = timedelta(minutes=session_timeout_minutes)
         self.session_timeout_minutes = session_timeout_minutes  # Store for easy access
         self._cleanup_task = None
+        # Short-lived read cache for callers that only inspect a session (e.g. the router):
+        # session_id -> (cached_at monotonic time, SessionData)
+        self._session_cache: Dict[str, tuple] = {}
+        self._session_cache_ttl = 30
+        self._session_cache_max_size = 10000
         logger.info(f"SessionManager initialized with {session_timeout_minutes} minute timeout")
     
     async def start_cleanup_task(self):
@@ -474,9 +523,36 @@ class SessionManager(ObservabilityMixin):
         
         return session_data
     
+    async def get_cached_session(self, session_id: str) -> Optional['SessionData']:
+        """
+        Read-only session lookup served from a short TTL in-process cache.
+        Falls back to get_session on a miss; entries are dropped on save/delete.
+        Callers must not mutate the returned session.
+        """
+        if not session_id:
+            return None
+
+        cached = self._session_cache.get(session_id)
+        if cached and time.monotonic() - cached[0] < self._session_cache_ttl:
+            return cached[1]
+
+        session_data = await self.get_session(session_id)
+        if session_data:
+            if len(self._session_cache) >= self._session_cache_max_size:
+                self._session_cache.pop(next(iter(self._session_cache)))
+            self._session_cache[session_id] = (time.monotonic(), session_data)
+        else:
+            self._session_cache.pop(session_id, None)
+        return session_data
+
+    def invalidate_cached_session(self, session_id: str):
+        """Drop a session from the read cache."""
+        self._session_cache.pop(session_id, None)
+
     @monitor
     async def save_session(self, session_data: 'SessionData') -> bool:
         """Enhanced session saving with validation."""
+        self.invalidate_cached_session(session_data.session_id)
         session_data.updated_at = datetime.utcnow()
         session_data.last_activity = datetime.utcnow()
         
@@ -492,6 +568,7 @@ class SessionManager(ObservabilityMixin):
     @monitor
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session with logging."""
+        self.invalidate_cached_session(session_id)
         success = await self.storage_backend.delete_session(session_id)
         
         if success:
@@ -571,6 +648,7 @@ class SessionManager(ObservabilityMixin):
     async def clear_all_sessions(self):
         """Clear all sessions - useful for debugging or resetting state."""
         try:
+            self._session_cache.clear()
             cleared_count = await self.storage_backend.clear_all_sessions()
             self.log_info(f"Cleared {cleared_count} sessions")
             return cleared_count
@@ -741,7 +819,7 @@ class InMemorySessionStorage:
                         active_sessions += 1
                     
                     # Count by state
-                    state = session_data.state.value if isinstance(session_data.state, SessionState) else session_data.state
+                    state = session_data.state.value
                     sessions_by_state[state] = sessions_by_state.get(state, 0) + 1
                     
                     # Count sessions created today
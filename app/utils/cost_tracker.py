@@ -1,5 +1,6 @@
 # app/utils/cost_tracker.py
 import logging
+from collections import deque
 from typing import Any, Dict, List, Optional
 from langchain.callbacks.base import BaseCallbackHandler
 from langchain.schema import LLMResult
@@ -7,6 +8,9 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Most recent LLM calls kept per callback; the shared Gemini client lives for the whole process
+CALL_HISTORY_LIMIT = 1000
+
 class GeminiPricing:
     """Google Gemini API pricing constants (as of 2024-2025)"""
     
@@ -51,7 +55,7 @@ class CostTrackingCallback(BaseCallbackHandler):
         self.total_cost = 0.0
         self.total_input_cost = 0.0
         self.total_output_cost = 0.0
-        self.call_history = []
+        self.call_history = deque(maxlen=CALL_HISTORY_LIMIT)
         
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         """Called when LLM ends running."""
@@ -11,6 +11,10 @@ from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
 
 logger = logging.getLogger(__name__)
 
+# Case-insensitive equality (strength 2 ignores case, not diacritics).
+# Queries must pass the same collation to use indexes built with it.
+CASE_INSENSITIVE_COLLATION = {"locale": "en", "strength": 2}
+
 
 async def create_all_indexes(db: AsyncIOMotorDatabase):
     """
@@ -52,7 +56,8 @@ async def create_user_indexes(db: AsyncIOMotorDatabase):
     logger.info("Creating indexes for users collection...")
 
     indexes = [
-        IndexModel([("email", ASCENDING)], unique=True),
+        IndexModel([("email", ASCENDING)], unique=True, name="email_ci",
+                   collation=CASE_INSENSITIVE_COLLATION),
         IndexModel([("created_at", DESCENDING)]),
         IndexModel([("role", ASCENDING)]),
         IndexModel([("is_active", ASCENDING)]),
@@ -67,12 +72,12 @@ async def create_form_template_indexes(db: AsyncIOMotorDatabase):
     logger.info("Creating indexes for form_templates collection...")
 
     indexes = [
-        IndexModel([("context_id", ASCENDING)]),
         IndexModel([("status", ASCENDING)]),
         IndexModel([("created_at", DESCENDING)]),
         IndexModel([("title", TEXT)]),
-        IndexModel([("tags", ASCENDING)]),
-        IndexModel([("context_id", ASCENDING), ("status", ASCENDING)]),  # Compound index
+        IndexModel([("tags", ASCENDING), ("context_id", ASCENDING)]),  # Also serves tags lookups
+        # Also serves context_id and (context_id, status) lookups
+        IndexModel([("context_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)]),
     ]
 
     await db.form_templates.create_indexes(indexes)
@@ -84,8 +89,6 @@ async def create_form_response_indexes(db: AsyncIOMotorDatabase):
     logger.info("Creating indexes for form_responses collection...")
 
     indexes = [
-        IndexModel([("form_template_id", ASCENDING)]),
-        IndexModel([("user_id", ASCENDING)]),
         IndexModel([("status", ASCENDING)]),
         IndexModel([("submitted_at", DESCENDING)]),
         IndexModel([("created_at", DESCENDING)]),
@@ -119,8 +122,6 @@ async def create_conversation_log_indexes(db: AsyncIOMotorDatabase):
     logger.info("Creating indexes for conversation_logs collection...")
 
     indexes = [
-        IndexModel([("session_id", ASCENDING)]),
-        IndexModel([("user_id", ASCENDING)]),
         IndexModel([("timestamp", DESCENDING)]),
         IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)]),  # Compound index
         IndexModel([("session_id", ASCENDING), ("timestamp", DESCENDING)]),  # Compound index
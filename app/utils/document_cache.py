@@ -0,0 +1,55 @@
+# app/utils/document_cache.py
+"""
+Short-lived in-process cache for read-mostly MongoDB documents
+(form templates, contexts) that are fetched by _id on every chat turn.
+"""
+import time
+import logging
+from typing import Any, Dict, Optional, Tuple
+from bson import ObjectId
+
+logger = logging.getLogger(__name__)
+
+_DOCUMENT_CACHE_TTL = 60  # seconds; bounds staleness across worker processes
+_DOCUMENT_CACHE_MAX_SIZE = 1024
+
+# (collection name, str id) -> (fetched_at, document)
+_document_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+
+async def get_cached_document(db, collection_name: str, doc_id: Any) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a document by _id, serving repeat reads from the in-process cache.
+    Misses (None) are not cached. Callers must not mutate the returned document.
+    """
+    cached = peek_cached_document(collection_name, doc_id)
+    if cached is not None:
+        return cached
+
+    # getattr rather than db[name]: app.database.db only proxies attribute access
+    document = await getattr(db, collection_name).find_one({"_id": ObjectId(doc_id)})
+    if document is not None:
+        store_cached_document(collection_name, doc_id, document)
+    else:
+        invalidate_cached_document(collection_name, doc_id)
+    return document
+
+
+def peek_cached_document(collection_name: str, doc_id: Any) -> Optional[Dict[str, Any]]:
+    """Return the cached document if it is still fresh, without touching the database."""
+    cached = _document_cache.get((collection_name, str(doc_id)))
+    if cached and time.monotonic() - cached[0] < _DOCUMENT_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def store_cached_document(collection_name: str, doc_id: Any, document: Dict[str, Any]) -> None:
+    """Cache a document fetched by some other query (e.g. an aggregation)."""
+    if len(_document_cache) >= _DOCUMENT_CACHE_MAX_SIZE:
+        _document_cache.pop(next(iter(_document_cache)))
+    _document_cache[(collection_name, str(doc_id))] = (time.monotonic(), document)
+
+
+def invalidate_cached_document(collection_name: str, doc_id: Any) -> None:
+    """Drop a document from the cache after it has been written."""
+    _document_cache.pop((collection_name, str(doc_id)), None)
@@ -1,7 +1,8 @@
 # app/utils/index_manager.py
 import logging
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import IndexModel
+from pymongo import IndexModel, ASCENDING, DESCENDING
+from app.utils.db_indexes import CASE_INSENSITIVE_COLLATION
 
 logger = logging.getLogger(__name__)
 
@@ -9,14 +10,17 @@ async def create_indexes(db: AsyncIOMotorDatabase):
     """Creates necessary indexes for collections on application startup."""
     logger.info("Applying database indexes...")
     try:
-        await db.users.create_index("email", unique=True)
+        await db.users.create_index("email", unique=True, name="email_ci", collation=CASE_INSENSITIVE_COLLATION)
         await db.contexts.create_index("assigned_users")
-        await db.form_templates.create_index("context_id")
-        await db.form_responses.create_index("form_template_id")
+        # Compounds rather than their single-field prefixes, matching db_indexes
+        await db.form_templates.create_index(
+            [("context_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)]
+        )
+        await db.form_responses.create_index([("form_template_id", ASCENDING), ("status", ASCENDING)])
         
         # --- NEW INDEX FOR CONVERSATION LOGS ---
         await db.conversation_logs.create_indexes([
-            IndexModel("session_id"),
+            IndexModel([("session_id", ASCENDING), ("timestamp", DESCENDING)]),
             IndexModel("form_response_id")
         ])
 
@@ -6,10 +6,19 @@ from app.utils.cost_tracker import CostTrackingCallback
 
 logger = logging.getLogger(__name__)
 
+# Process-wide client; agents and nodes are built per message and all share it
+_gemini_llm = None
+
 def get_gemini_llm() -> ChatGoogleGenerativeAI:
     """
     Initializes and returns the Gemini LLM client with cost tracking.
+    The real client is created once and reused; MockLLM fallbacks are not cached,
+    so a transient initialization failure is retried on the next call.
     """
+    global _gemini_llm
+    if _gemini_llm is not None:
+        return _gemini_llm
+
     api_key = settings.GEMINI_API_KEY
     logger.info("Initializing Gemini LLM...")
 
@@ -26,6 +35,7 @@ def get_gemini_llm() -> ChatGoogleGenerativeAI:
             callbacks=[CostTrackingCallback()] # <-- Cost tracking is integrated here
         )
         logger.info("Successfully initialized real Gemini LLM.")
+        _gemini_llm = llm
         return llm
     except Exception as e:
         logger.error(f"Failed to initialize real Gemini LLM: {e}")
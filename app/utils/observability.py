@@ -3,18 +3,27 @@ Observability utilities for the AI Form Assistant Application
 Provides logging, monitoring, and metrics collection capabilities
 """
 import functools
+import os
 import time
 import logging
 from typing import Callable, Any
 import asyncio
 import inspect
 
+# Per-call timing logs from the monitor decorators; off unless OBSERVABILITY_ENABLED=1.
+# Resolved once at import so disabled decorators return the function untouched.
+OBSERVABILITY_ENABLED = os.environ.get("OBSERVABILITY_ENABLED") == "1"
+
 
 class ObservabilityMixin:
     """
     A mixin class that provides basic observability features like logging to classes.
     """
-    
+
+    # Empty so slotted subclasses stay dict-free; the lazily cached _logger
+    # lands in the subclass's slot or __dict__.
+    __slots__ = ()
+
     @property
     def logger(self):
         """Get a logger instance for the class."""
@@ -47,6 +56,8 @@ def monitor(func: Callable) -> Callable:
     A decorator to monitor function execution time and basic metrics.
     Works with both sync and async functions.
     """
+    if not OBSERVABILITY_ENABLED:
+        return func
     if inspect.iscoroutinefunction(func):
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
@@ -89,6 +100,9 @@ def monitor_async(func: Callable) -> Callable:
     """
     A decorator to monitor async function execution time and basic metrics.
     """
+    if not OBSERVABILITY_ENABLED:
+        return func
+
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         start_time = time.time()
@@ -0,0 +1,19 @@
+# tests/unit/conftest.py
+"""
+Unit tests exercise pure helpers and in-process caches; they need no MongoDB,
+Redis or running API server. The fixtures below replace the autouse
+database fixtures from tests/conftest.py for everything in this directory.
+"""
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def db_connection_session():
+    """No database connection for unit tests."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clean_db():
+    """Nothing to clean without a database."""
+    yield
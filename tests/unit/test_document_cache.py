@@ -0,0 +1,109 @@
+# tests/unit/test_document_cache.py
+import pytest
+from bson import ObjectId
+
+from app.utils import document_cache
+from app.utils.document_cache import (
+    get_cached_document,
+    invalidate_cached_document,
+    peek_cached_document,
+    store_cached_document,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(document_cache, "_document_cache", {})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(document_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class _Collection:
+    def __init__(self, documents):
+        self.documents = documents
+        self.queries = []
+
+    async def find_one(self, query):
+        self.queries.append(query)
+        return self.documents.get(query["_id"])
+
+
+class _Database:
+    def __init__(self, documents):
+        self.form_templates = _Collection(documents)
+
+
+@pytest.mark.asyncio
+async def test_get_cached_document_reads_database_once():
+    oid = ObjectId()
+    db = _Database({oid: {"_id": oid, "title": "Vitals"}})
+
+    first = await get_cached_document(db, "form_templates", str(oid))
+    second = await get_cached_document(db, "form_templates", oid)
+
+    assert first == second == {"_id": oid, "title": "Vitals"}
+    assert db.form_templates.queries == [{"_id": oid}]
+
+
+@pytest.mark.asyncio
+async def test_get_cached_document_does_not_cache_misses():
+    oid = ObjectId()
+    db = _Database({})
+
+    assert await get_cached_document(db, "form_templates", oid) is None
+    db.form_templates.documents[oid] = {"_id": oid}
+    assert await get_cached_document(db, "form_templates", oid) == {"_id": oid}
+    assert len(db.form_templates.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl(clock):
+    oid = ObjectId()
+    db = _Database({oid: {"_id": oid}})
+
+    await get_cached_document(db, "form_templates", oid)
+    clock[0] += document_cache._DOCUMENT_CACHE_TTL - 1
+    await get_cached_document(db, "form_templates", oid)
+    assert len(db.form_templates.queries) == 1
+
+    clock[0] += 1
+    await get_cached_document(db, "form_templates", oid)
+    assert len(db.form_templates.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_oldest_entry_is_evicted_at_max_size(monkeypatch):
+    monkeypatch.setattr(document_cache, "_DOCUMENT_CACHE_MAX_SIZE", 2)
+    oids = [ObjectId() for _ in range(3)]
+    db = _Database({oid: {"_id": oid} for oid in oids})
+    for oid in oids:
+        await get_cached_document(db, "form_templates", oid)
+
+    assert set(document_cache._document_cache) == {("form_templates", str(oid)) for oid in oids[1:]}
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_a_fresh_read():
+    oid = ObjectId()
+    db = _Database({oid: {"_id": oid, "title": "Old"}})
+    await get_cached_document(db, "form_templates", oid)
+
+    db.form_templates.documents[oid] = {"_id": oid, "title": "New"}
+    invalidate_cached_document("form_templates", oid)
+    invalidate_cached_document("form_templates", "missing")
+    assert (await get_cached_document(db, "form_templates", oid))["title"] == "New"
+
+
+def test_store_and_peek_accept_str_or_object_id(clock):
+    oid = ObjectId()
+    store_cached_document("form_templates", oid, {"_id": oid})
+    assert peek_cached_document("form_templates", str(oid)) == {"_id": oid}
+    assert peek_cached_document("contexts", oid) is None
+
+    clock[0] += document_cache._DOCUMENT_CACHE_TTL
+    assert peek_cached_document("form_templates", oid) is None
@@ -0,0 +1,91 @@
+# tests/unit/test_finalize_form.py
+import orjson
+import pytest
+from bson import ObjectId
+
+from app.agents.enhanced_form_filler_agent import EnhancedFormFillerAgent
+from app.sessions import session_manager
+from app.sessions.session_manager import SessionData
+
+TEMPLATE = {
+    "fields": [
+        {"field_id": "name", "label": "Name", "field_type": "text", "required": True},
+        {"field_id": "agree", "label": "Agree", "field_type": "boolean"},
+    ],
+}
+
+
+class _Redis:
+    def __init__(self):
+        self.writes = []
+
+    async def setex(self, key, ttl, value):
+        self.writes.append((key, orjson.loads(value)))
+
+
+class _InsertResult:
+    def __init__(self, inserted_id):
+        self.inserted_id = inserted_id
+
+
+class _FormResponses:
+    def __init__(self):
+        self.documents = []
+
+    async def insert_one(self, document):
+        self.documents.append(document)
+        return _InsertResult(ObjectId())
+
+
+class _Database:
+    def __init__(self):
+        self.form_responses = _FormResponses()
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = _Redis()
+
+    class _RedisManager:
+        async def get_redis(self):
+            return client
+
+    monkeypatch.setattr(session_manager, "RedisManager", _RedisManager)
+    return client
+
+
+def _agent(user_id, responses):
+    agent = EnhancedFormFillerAgent.__new__(EnhancedFormFillerAgent)
+    agent.db = _Database()
+    agent.form_template = TEMPLATE
+    agent.session_data = SessionData("session-1", user_id, str(ObjectId()), responses=dict(responses))
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_completed_state_and_submission_id_are_written_together(redis):
+    agent = _agent(str(ObjectId()), {"name": "Ana", "agree": "sim"})
+
+    submission_id = await agent._finalize_form()
+
+    assert [doc["status"] for doc in agent.db.form_responses.documents] == ["complete"]
+    assert len(redis.writes) == 1
+    assert redis.writes[0][1]["state"] == "COMPLETED"
+    assert redis.writes[0][1]["submission_id"] == submission_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("user_id, responses", [
+    ("not-an-object-id", {"name": "Ana"}),
+    (str(ObjectId()), {"name": "Ana", "agree": True}),
+])
+async def test_build_failure_takes_the_fallback_path(redis, user_id, responses):
+    agent = _agent(user_id, responses)
+
+    submission_id = await agent._finalize_form()
+
+    assert submission_id.startswith("fallback_")
+    assert agent.db.form_responses.documents == []
+    assert [write[1]["state"] for write in redis.writes] == ["COMPLETED"]
+    assert agent.session_data.form_template_id is None
+    assert agent.session_data.responses == {}
@@ -0,0 +1,162 @@
+# tests/unit/test_form_filler_helpers.py
+import re
+
+import pytest
+
+from app.agents import enhanced_form_filler_agent as agent_module
+from app.agents.enhanced_form_filler_agent import (
+    _CHANGE_COMMAND_RE,
+    _CONFIRM_NEGATIVE,
+    _CONFIRM_NEGATIVE_RE,
+    _CONFIRM_POSITIVE,
+    _CONFIRM_POSITIVE_RE,
+    _CONFIRM_REVIEW,
+    _CONFIRM_REVIEW_RE,
+    _FORM_PICK_NEGATIVE,
+    _FORM_PICK_NEGATIVE_RE,
+    _FORM_PICK_POSITIVE,
+    _FORM_PICK_POSITIVE_RE,
+    EnhancedFormFillerAgent,
+    _cache_field_change,
+    _field_change_cache_key,
+    _get_cached_field_change,
+    _is_direct_answer,
+    _is_valid_email,
+    _substring_matcher,
+)
+
+# The pattern _is_valid_email replaced
+EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+MESSAGES = [
+    "yes",
+    "sim, pode enviar",
+    "não, quero mudar o email",
+    "i know it looks good",
+    "show me a summary",
+    "that is not right",
+    "please change my phone",
+    "update the address",
+    "proceed with a different one",
+    "",
+    "xyz",
+]
+
+
+def test_substring_matcher_prefers_longest_indicator():
+    matcher = _substring_matcher({"no", "not right"})
+    assert matcher.search("that is not right").group() == "not right"
+
+
+def test_substring_matcher_escapes_regex_metacharacters():
+    matcher = _substring_matcher({"n/a", "a.b"})
+    assert matcher.search("it is n/a")
+    assert not matcher.search("axb")
+
+
+@pytest.mark.parametrize("indicators, pattern", [
+    (_CONFIRM_POSITIVE, _CONFIRM_POSITIVE_RE),
+    (_CONFIRM_NEGATIVE, _CONFIRM_NEGATIVE_RE),
+    (_CONFIRM_REVIEW, _CONFIRM_REVIEW_RE),
+    (_FORM_PICK_POSITIVE, _FORM_PICK_POSITIVE_RE),
+    (_FORM_PICK_NEGATIVE, _FORM_PICK_NEGATIVE_RE),
+    ({"change", "modify", "update"}, _CHANGE_COMMAND_RE),
+])
+@pytest.mark.parametrize("message", MESSAGES)
+def test_matchers_keep_any_substring_semantics(indicators, pattern, message):
+    assert bool(pattern.search(message)) == any(i in message for i in indicators)
+
+
+@pytest.mark.parametrize("value", [
+    "user@example.com",
+    "first.last+tag@sub.example.co",
+    "a_b%c-d@host-name.io",
+    "a@..co",
+    "a@b.c",
+    "a@b.co.1",
+    "a@.co",
+    "@example.com",
+    "user@",
+    "user@example",
+    "user@@example.com",
+    "a@b@c.com",
+    "user name@example.com",
+    "usér@example.com",
+    "user@exa_mple.com",
+    "user@example.c0m",
+    "",
+])
+def test_is_valid_email_matches_regex(value):
+    assert _is_valid_email(value) == bool(EMAIL_RE.match(value))
+
+
+@pytest.mark.parametrize("message, expected", [
+    ("yes", True),
+    ("João Silva", True),
+    ("(11) 98765-4321", True),
+    ("2024-03-15", True),
+    ("12 34 56 78 90", True),
+    ("my name is John", False),
+    ("nome João e email joao@x.com", False),
+])
+def test_is_direct_answer(message, expected):
+    assert _is_direct_answer(message) is expected
+
+
+@pytest.fixture
+def agent():
+    # Basic type validation never touches the database or the LLM
+    return EnhancedFormFillerAgent.__new__(EnhancedFormFillerAgent)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("answer, processed", [
+    ("2024-03-15", "2024-03-15"),
+    (" 2024-03-15 ", "2024-03-15"),
+    ("03/15/2024", "2024-03-15"),
+    ("15/03/2024", "2024-03-15"),
+    ("2024-03-15 10:30:00", "2024-03-15"),
+])
+async def test_date_validation_accepts_supported_formats(agent, answer, processed):
+    result = await agent._validate_field_response({"field_id": "d", "field_type": "date"}, answer)
+    assert result["is_valid"]
+    assert result["processed_value"] == processed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("answer", ["2024-02-30", "2024-13-01", "2024/03/15", "amanhã"])
+async def test_date_validation_rejects_invalid_dates(agent, answer):
+    result = await agent._validate_field_response({"field_id": "d", "field_type": "date"}, answer)
+    assert not result["is_valid"]
+
+
+@pytest.fixture
+def field_change_cache(monkeypatch):
+    monkeypatch.setattr(agent_module, "_FIELD_CHANGE_CACHE", {})
+    return agent_module._FIELD_CHANGE_CACHE
+
+
+def test_field_change_cache_key_normalizes_message(field_change_cache):
+    assert _field_change_cache_key("t1", "Change  MY email", ["a", "b"]) == \
+        _field_change_cache_key("t1", "change my email", {"b", "a"})
+
+
+def test_field_change_cache_expires(field_change_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(agent_module.time, "monotonic", lambda: now[0])
+    key = _field_change_cache_key("t1", "change email", ["email"])
+    _cache_field_change(key, "email")
+    assert _get_cached_field_change(key) == "email"
+
+    now[0] += agent_module._FIELD_CHANGE_CACHE_TTL
+    assert _get_cached_field_change(key) is None
+
+
+def test_field_change_cache_evicts_oldest_entry(field_change_cache, monkeypatch):
+    monkeypatch.setattr(agent_module, "_FIELD_CHANGE_CACHE_MAX_SIZE", 2)
+    keys = [_field_change_cache_key("t1", f"change {i}", []) for i in range(3)]
+    for i, key in enumerate(keys):
+        _cache_field_change(key, f"f{i}")
+
+    assert _get_cached_field_change(keys[0]) is None
+    assert [_get_cached_field_change(k) for k in keys[1:]] == ["f1", "f2"]
@@ -0,0 +1,113 @@
+# tests/unit/test_index_specs.py
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+import add_performance_indexes
+from add_performance_indexes import INDEX_SPECS, _index_document, _hot_window_start, find_shadowed_indexes
+from app.utils import db_indexes
+from app.utils.db_indexes import CASE_INSENSITIVE_COLLATION
+
+
+def _idx(name, *key, **opts):
+    return {"name": name, "key": dict(key), **opts}
+
+
+def test_prefix_of_compound_is_shadowed():
+    indexes = [
+        _idx("_id_", ("_id", 1)),
+        _idx("user_id_1", ("user_id", 1)),
+        _idx("user_id_1_created_at_-1", ("user_id", 1), ("created_at", -1)),
+    ]
+    assert find_shadowed_indexes(indexes) == ["user_id_1"]
+
+
+def test_direction_and_order_must_match():
+    indexes = [
+        _idx("a_-1", ("a", -1)),
+        _idx("b_1", ("b", 1)),
+        _idx("a_1_b_1", ("a", 1), ("b", 1)),
+    ]
+    assert find_shadowed_indexes(indexes) == []
+
+
+def test_unique_and_partial_indexes_are_ignored():
+    indexes = [
+        _idx("email_ci", ("email", 1), unique=True),
+        _idx("email_1_name_1", ("email", 1), ("name", 1)),
+        _idx("status_1", ("status", 1)),
+        _idx("status_1_created_at_-1", ("status", 1), ("created_at", -1),
+             partialFilterExpression={"status": "active"}),
+    ]
+    assert find_shadowed_indexes(indexes) == []
+
+
+@pytest.mark.parametrize("now, expected", [
+    (datetime(2026, 10, 15, tzinfo=timezone.utc), datetime(2026, 4, 1)),
+    (datetime(2026, 3, 31, tzinfo=timezone.utc), datetime(2025, 9, 1)),
+    (datetime(2026, 6, 1, tzinfo=timezone.utc), datetime(2025, 12, 1)),
+    (datetime(2026, 7, 1, tzinfo=timezone.utc), datetime(2026, 1, 1)),
+])
+def test_hot_window_starts_on_first_of_month(monkeypatch, now, expected):
+    monkeypatch.setattr(add_performance_indexes, "HOT_WINDOW_MONTHS", 6)
+    assert _hot_window_start(now) == expected
+
+
+def test_user_identifiers_are_unique_case_insensitively():
+    documents = {
+        doc["name"]: doc
+        for doc in (_index_document(key, opts) for key, opts in INDEX_SPECS["users"])
+    }
+    for name in ("email_ci", "username_ci"):
+        assert documents[name]["unique"] is True
+        assert documents[name]["collation"] == CASE_INSENSITIVE_COLLATION
+    assert documents["username_ci"]["partialFilterExpression"] == {"username": {"$type": "string"}}
+    assert "replaces" not in documents["email_ci"]
+
+
+class _RecordingCollection:
+    def __init__(self):
+        self.indexes = []
+
+    async def create_indexes(self, models):
+        self.indexes.extend(model.document for model in models)
+
+
+class _RecordingDatabase:
+    def __init__(self):
+        self.collections = {}
+
+    def __getattr__(self, name):
+        return self.collections.setdefault(name, _RecordingCollection())
+
+
+def _startup_indexes():
+    db = _RecordingDatabase()
+    asyncio.run(db_indexes.create_all_indexes(db))
+    return {name: coll.indexes for name, coll in db.collections.items()}
+
+
+@pytest.mark.parametrize("collection_name", sorted(INDEX_SPECS))
+def test_startup_and_script_indexes_leave_nothing_shadowed(collection_name):
+    """The script's own check must pass on a database the app has started against."""
+    specs = INDEX_SPECS[collection_name]
+    script = [_index_document(key, opts) for key, opts in specs]
+    superseded = {name for _, opts in specs for name in opts.get("replaces", ())}
+    startup = [
+        idx for idx in _startup_indexes().get(collection_name, [])
+        if idx["name"] not in superseded
+    ]
+    by_name = {idx["name"]: idx for idx in startup + script}
+    assert find_shadowed_indexes(list(by_name.values())) == []
+
+
+def test_shared_index_names_have_identical_keys():
+    """Startup and the script must not build different keys under one name."""
+    startup = _startup_indexes()
+    for collection_name, specs in INDEX_SPECS.items():
+        startup_keys = {idx["name"]: dict(idx["key"]) for idx in startup.get(collection_name, [])}
+        for key, opts in specs:
+            document = _index_document(key, opts)
+            if document["name"] in startup_keys:
+                assert startup_keys[document["name"]] == document["key"], document["name"]
@@ -0,0 +1,46 @@
+# tests/unit/test_intent_prefilter.py
+import pytest
+
+from app.agents import _keyword_intent
+
+# The examples listed in the LLM classifier prompt. The prefilter may leave a
+# message to the classifier (None) but must never contradict the prompt.
+PROMPT_EXAMPLES = [
+    ("I need to fill out a form", "fill_form"),
+    ("help me with the safety report", "fill_form"),
+    ("I want to submit information", "fill_form"),
+    ("show me yesterday's reports", "search_forms"),
+    ("find John's safety forms", "search_forms"),
+    ("what forms were submitted today", "search_forms"),
+    ("generate a summary", "generate_report"),
+    ("show me analytics", "generate_report"),
+    ("create a report", "generate_report"),
+    ("what are the trends", "generate_report"),
+]
+
+
+@pytest.mark.parametrize("message, intent", PROMPT_EXAMPLES)
+def test_prefilter_agrees_with_classifier_prompt(message, intent):
+    assert _keyword_intent(message.lower()) in (intent, None)
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("i need to fill out a form", "fill_form"),
+    ("quero preencher o formulário de segurança", "fill_form"),
+    ("find john's safety forms", "search_forms"),
+    ("buscar relatórios de ontem", "search_forms"),
+    ("show me analytics", "generate_report"),
+    ("gerar uma análise das respostas", "generate_report"),
+])
+def test_prefilter_routes_unambiguous_keywords(message, intent):
+    assert _keyword_intent(message) == intent
+
+
+@pytest.mark.parametrize("message", [
+    "help me with the safety report",
+    "show me yesterday's reports",
+    "find the summary of last week's forms",
+    "i want to submit information",
+])
+def test_ambiguous_messages_fall_through_to_classifier(message):
+    assert _keyword_intent(message) is None
@@ -0,0 +1,39 @@
+# tests/unit/test_routing.py
+from itertools import product
+
+import pytest
+
+from app.agents.routing import PREDICTOR_ROUTE_TABLE, ROUTER_EDGES, has_form_template_id
+
+
+def test_predictor_table_covers_every_flag_combination():
+    assert set(PREDICTOR_ROUTE_TABLE) == set(product((True, False), repeat=3))
+    assert set(PREDICTOR_ROUTE_TABLE.values()) <= set(ROUTER_EDGES)
+
+
+@pytest.mark.parametrize("flags", list(product((True, False), repeat=3)))
+def test_predictor_routes_match_previous_conditions(flags):
+    has_error, requires_clarification, has_template = flags
+    # The if/elif chain the table replaced
+    if has_error:
+        expected = "error"
+    elif requires_clarification or has_template:
+        expected = "form_filler"
+    else:
+        expected = "error"
+    assert PREDICTOR_ROUTE_TABLE[flags] == expected
+
+
+def test_router_edges_map_each_node_to_itself():
+    assert all(key == value for key, value in ROUTER_EDGES.items())
+
+
+@pytest.mark.parametrize("form_template_id, expected", [
+    ("64b000000000000000000000", True),
+    (0, True),
+    (None, False),
+    ("", False),
+    ("   ", False),
+])
+def test_has_form_template_id(form_template_id, expected):
+    assert has_form_template_id(form_template_id) is expected
@@ -0,0 +1,57 @@
+# tests/unit/test_session_data.py
+import pytest
+from bson import ObjectId
+
+from app.sessions.session_manager import SessionData, SessionState
+
+
+@pytest.mark.parametrize("value, expected", [
+    (SessionState.CONFIRMATION, SessionState.CONFIRMATION),
+    ("CONFIRMATION", SessionState.CONFIRMATION),
+    ("completed", SessionState.COMPLETED),
+    ("not-a-state", SessionState.IN_PROGRESS),
+    (None, SessionState.IN_PROGRESS),
+])
+def test_state_is_coerced_to_enum(value, expected):
+    session = SessionData("s-1", "u-1")
+    session.state = value
+    assert session.state is expected
+
+
+def test_state_defaults_to_starting_and_round_trips():
+    session = SessionData("s-1", "u-1")
+    assert session.state is SessionState.STARTING
+
+    session.state = SessionState.COMPLETED
+    restored = SessionData.from_dict(session.to_dict())
+    assert restored.state is SessionState.COMPLETED
+
+
+def test_object_ids_are_parsed_once_and_follow_reassignment():
+    template_id, other_id, user_id = ObjectId(), ObjectId(), ObjectId()
+    session = SessionData("s-1", str(user_id), str(template_id))
+
+    assert session.user_oid == user_id
+    assert session.form_template_oid == template_id
+    assert session.form_template_oid is session.form_template_oid
+
+    session.form_template_id = str(other_id)
+    assert session.form_template_oid == other_id
+
+    session.form_template_id = None
+    assert session.form_template_oid is None
+
+
+def test_object_ids_pass_through_and_reject_invalid_ids():
+    template_id = ObjectId()
+    session = SessionData("s-1", "not-an-object-id", template_id)
+    assert session.form_template_oid is template_id
+    assert session.user_oid is None
+
+
+def test_parsed_object_ids_are_not_serialized():
+    session = SessionData("s-1", str(ObjectId()), str(ObjectId()))
+    session.form_template_oid
+    data = session.to_dict()
+    assert "_oid_cache" not in data
+    assert "form_template_oid" not in data
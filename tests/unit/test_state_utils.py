@@ -0,0 +1,92 @@
+# tests/unit/test_state_utils.py
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel, Field
+
+from app.agents.base.utils import state_get, state_get_many, state_set
+
+
+class ModelState(BaseModel):
+    session_id: Optional[str] = None
+    history: List[str] = Field(default_factory=list)
+
+    @property
+    def history_size(self) -> int:
+        return len(self.history)
+
+
+class ObjectState:
+    def __init__(self):
+        self.session_id = "obj-1"
+
+
+class MappingState:
+    """Item access only, like a TypedDict-backed LangGraph channel view."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+
+@pytest.mark.parametrize("state", [
+    {"session_id": "s-1"},
+    ModelState(session_id="s-1"),
+    MappingState({"session_id": "s-1"}),
+])
+def test_state_get_reads_each_state_kind(state):
+    assert state_get(state, "session_id") == "s-1"
+    assert state_get(state, "missing", "fallback") == "fallback"
+
+
+def test_state_get_on_plain_object_and_none():
+    assert state_get(ObjectState(), "session_id") == "obj-1"
+    assert state_get(ObjectState(), "missing", 3) == 3
+    assert state_get(None, "session_id", "d") == "d"
+
+
+def test_state_get_returns_live_model_values():
+    # Values come straight from the model, not from a model_dump() copy
+    state = ModelState(history=["hi"])
+    history = state_get(state, "history")
+    assert history is state.history
+    history.append("again")
+    assert state.history == ["hi", "again"]
+
+
+def test_state_get_reads_model_properties():
+    assert state_get(ModelState(history=["a", "b"]), "history_size") == 2
+
+
+def test_state_get_resolves_strategy_per_class():
+    # A second instance of the same class goes through the cached accessor
+    assert state_get(ModelState(session_id="a"), "session_id") == "a"
+    assert state_get(ModelState(session_id="b"), "session_id") == "b"
+
+
+@pytest.mark.parametrize("state", [
+    {"session_id": "s-1", "user_message": "hello"},
+    ModelState(session_id="s-1"),
+])
+def test_state_get_many_matches_state_get(state):
+    keys = ("session_id", "user_message", "missing")
+    defaults = ("x", "", 0)
+    assert state_get_many(state, keys, defaults) == tuple(
+        state_get(state, key, default) for key, default in zip(keys, defaults)
+    )
+
+
+def test_state_get_many_defaults():
+    assert state_get_many({"a": 1}, ("a", "b")) == (1, None)
+    assert state_get_many(None, ("a", "b"), (1, 2)) == (1, 2)
+
+
+def test_state_set_dict_and_object():
+    state = {}
+    obj = ObjectState()
+    assert state_set(state, "next_node", "error")
+    assert state_set(obj, "next_node", "error")
+    assert state["next_node"] == "error"
+    assert obj.next_node == "error"